@@ -7,6 +7,9 @@
 agent_usage_reminder.py
 PostToolUse hook: Reminds Claude to delegate to agents instead of using
 search tools directly.
+
+The reminder fires at most once per session, and not at all once the
+session has delegated to an agent.
 """
 
 from pathlib import Path
@@ -15,7 +18,9 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
 from hook_utils import (
+    claim_marker,
     get_nested,
+    has_marker,
     hook_main,
     is_agent_session,
     log_debug,
@@ -48,6 +53,11 @@ Benefits: Parallel execution, context protection, specialized expertise.
 "Grep is faster" → Faster at typing, slower at tokens."""
 
 
+def _marker(kind: str, session_id: str) -> str:
+    """Name of this session's marker of the given kind."""
+    return f"omc_{kind}_{session_id}"
+
+
 @hook_main("PostToolUse")
 def main() -> None:
     raw = read_stdin_safe()
@@ -62,20 +72,30 @@ def main() -> None:
 
     # Get tool name from hook input
     tool_name = get_nested(data, "tool_name", default="")
+    session_id = get_nested(data, "session_id", default="") or ""
 
-    log_debug(f"tool_name={tool_name}")
+    log_debug(lambda: f"tool_name={tool_name} session_id={session_id}")
 
-    # If this invocation is for an agent tool, no reminder needed
+    # Agent tool used - remember it so later searches aren't nagged
     if tool_name in AGENT_TOOLS:
+        if session_id:
+            claim_marker(_marker("agent_used", session_id))
         return output_empty()
 
-    # Show reminder when a direct search tool was used
-    if tool_name in DIRECT_SEARCH_TOOLS:
-        log_debug("showing agent reminder")
-        output_context("PostToolUse", REMINDER_MESSAGE)
-    else:
+    if tool_name not in DIRECT_SEARCH_TOOLS:
         return output_empty()
 
+    # Without a session_id there is nothing to dedup against
+    if session_id and (
+        has_marker(_marker("agent_used", session_id))
+        or not claim_marker(_marker("reminded", session_id))
+    ):
+        log_debug("reminder already shown or agent used this session")
+        return output_empty()
+
+    log_debug("showing agent reminder")
+    output_context("PostToolUse", REMINDER_MESSAGE)
+
 
 if __name__ == "__main__":
     main()
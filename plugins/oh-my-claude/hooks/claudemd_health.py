@@ -14,16 +14,16 @@ Checks:
 - Nested CLAUDE.md opportunities (when root is large)
 """
 
+import os
 import re
+from itertools import islice
 from pathlib import Path
 
 from hook_utils import (
-    get_nested,
     hook_main,
     output_context,
     output_empty,
-    parse_hook_input,
-    read_stdin_safe,
+    read_hook_input,
 )
 
 # Thresholds
@@ -55,6 +55,36 @@ CONTENT_PATTERNS = {
     "hooks": (r"hook|use[A-Z]", "src/hooks/CLAUDE.md or hooks/CLAUDE.md"),
 }
 
+# Imperative verbs commonly starting instructions
+IMPERATIVE_VERBS = (
+    "use", "do", "don't", "never", "always", "must", "should", "ensure",
+    "make", "keep", "avoid", "prefer", "run", "check", "verify", "validate",
+    "set", "create", "delete", "update", "add", "remove", "call", "return",
+    "follow", "include", "exclude",
+)
+
+# One instruction per matching line, evaluated over the whole file in a
+# single scan (leading whitespace ignored, as if the line were stripped):
+# - a bullet ("-" or "*") with more than two characters, or
+# - an imperative verb followed by a comma, or a space and more text
+INSTRUCTION_REGEX = re.compile(
+    r"^[^\S\n]*(?:[-*][^\n]+\S|(?:"
+    + "|".join(re.escape(verb) for verb in IMPERATIVE_VERBS)
+    + r")(?:,| [^\n]*\S))",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# Fused alternation compiled once, so content is scanned in a single pass
+# instead of once per pattern.
+PATH_REGEX = re.compile("|".join(f"(?:{p})" for p in PATH_PATTERNS), re.IGNORECASE)
+
+# Content topics stay separate patterns: a fused alternation would let one
+# topic consume text another also matches ("routest" is both api and testing)
+CONTENT_REGEXES = {topic: re.compile(pattern) for topic, (pattern, _) in CONTENT_PATTERNS.items()}
+
+# Mentions needed before a topic is worth its own CLAUDE.md
+TOPIC_MENTION_THRESHOLD = 5
+
 
 def count_instructions(content: str) -> int:
     """
@@ -64,66 +94,19 @@ def count_instructions(content: str) -> int:
     - Bullet points starting with - or *
     - Lines with imperative verbs (common instruction starters)
     """
-    count = 0
-    lines = content.split("\n")
-
-    # Imperative verbs commonly starting instructions
-    imperative_verbs = (
-        "use",
-        "do",
-        "don't",
-        "never",
-        "always",
-        "must",
-        "should",
-        "ensure",
-        "make",
-        "keep",
-        "avoid",
-        "prefer",
-        "run",
-        "check",
-        "verify",
-        "validate",
-        "set",
-        "create",
-        "delete",
-        "update",
-        "add",
-        "remove",
-        "call",
-        "return",
-        "follow",
-        "include",
-        "exclude",
-    )
-
-    for line in lines:
-        stripped = line.strip().lower()
-
-        # Count bullet points
-        if stripped.startswith(("-", "*")) and len(stripped) > 2:
-            count += 1
-            continue
-
-        # Count lines starting with imperative verbs
-        for verb in imperative_verbs:
-            if stripped.startswith(verb + " ") or stripped.startswith(verb + ","):
-                count += 1
-                break
-
-    return count
+    return sum(1 for _ in INSTRUCTION_REGEX.finditer(content))
 
 
 def find_hardcoded_paths(content: str) -> list[str]:
     """Find hardcoded file paths that may become stale."""
-    found: set[str] = set()
+    return list(set(PATH_REGEX.findall(content)))
 
-    for pattern in PATH_PATTERNS:
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        found.update(matches)
 
-    return list(found)
+def path_exists(cwd: Path, rel_path: str, seen: dict[str, bool]) -> bool:
+    """Check rel_path under cwd with a single stat, memoized in seen."""
+    if rel_path not in seen:
+        seen[rel_path] = os.path.exists(os.path.join(cwd, rel_path))
+    return seen[rel_path]
 
 
 def detect_nested_opportunities(cwd: Path, content: str) -> list[str]:
@@ -135,12 +118,22 @@ def detect_nested_opportunities(cwd: Path, content: str) -> list[str]:
     """
     suggestions: list[str] = []
 
+    # One directory listing replaces a stat per candidate; DirEntry.is_dir()
+    # uses the readdir file type and only stats symlinks
+    try:
+        with os.scandir(cwd) as entries:
+            present_dirs = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        present_dirs = set()
+
+    # CLAUDE.md lookups shared by both checks below (e.g. tests/CLAUDE.md)
+    seen: dict[str, bool] = {}
+
     # Find directories that exist but lack CLAUDE.md
-    missing_claudemd_dirs: list[str] = []
-    for dirname in COMMON_DIRS:
-        dir_path = cwd / dirname
-        if dir_path.is_dir() and not (dir_path / "CLAUDE.md").exists():
-            missing_claudemd_dirs.append(dirname)
+    missing_claudemd_dirs = [
+        dirname for dirname in COMMON_DIRS
+        if dirname in present_dirs and not path_exists(cwd, f"{dirname}/CLAUDE.md", seen)
+    ]
 
     if missing_claudemd_dirs:
         # Cap display at 5 directories to keep message concise
@@ -155,15 +148,16 @@ def detect_nested_opportunities(cwd: Path, content: str) -> list[str]:
 
     # Analyze content for domain-specific sections
     content_lower = content.lower()
-    for topic, (pattern, suggested_path) in CONTENT_PATTERNS.items():
-        # Check if content mentions this topic significantly (5+ matches)
-        matches = re.findall(pattern, content_lower)
-        if len(matches) >= 5:
+    for topic, (_, suggested_path) in CONTENT_PATTERNS.items():
+        # Check if content mentions this topic significantly, stopping the
+        # scan as soon as the threshold is reached
+        matches = CONTENT_REGEXES[topic].finditer(content_lower)
+        if sum(1 for _ in islice(matches, TOPIC_MENTION_THRESHOLD)) == TOPIC_MENTION_THRESHOLD:
             # Check if the suggested path already has CLAUDE.md
             # Extract first suggested directory from path
             first_suggestion = suggested_path.split(" or ")[0]
-            check_path = cwd / first_suggestion
-            if not check_path.exists():
+            top_dir = first_suggestion.split("/", 1)[0]
+            if top_dir not in present_dirs or not path_exists(cwd, first_suggestion, seen):
                 suggestions.append(
                     f"Content about '{topic}' could move to {suggested_path}"
                 )
@@ -176,34 +170,39 @@ def detect_nested_opportunities(cwd: Path, content: str) -> list[str]:
     return suggestions
 
 
-def analyze_claudemd(filepath: Path) -> list[str]:
+def truncate_lines(content: str, max_lines: int) -> str:
+    """Return the first max_lines lines of content without splitting it."""
+    end = -1
+    for _ in range(max_lines):
+        end = content.find("\n", end + 1)
+        if end == -1:
+            return content
+    return content[:end]
+
+
+def analyze_claudemd(content: str, line_count: int) -> list[str]:
     """
-    Analyze CLAUDE.md and return list of warning messages.
+    Analyze CLAUDE.md content and return list of warning messages.
 
     Returns empty list if file is healthy.
     """
     warnings: list[str] = []
 
-    try:
-        content = filepath.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
-        # Can't read file - not an error, just skip
-        return []
-
-    lines = content.split("\n")
-    line_count = len(lines)
-
     # Truncate analysis for very large files
     if line_count > MAX_LINES_TO_ANALYZE:
-        content = "\n".join(lines[:MAX_LINES_TO_ANALYZE])
+        content = truncate_lines(content, MAX_LINES_TO_ANALYZE)
         line_count = MAX_LINES_TO_ANALYZE
 
     # Check line count
     if line_count > MAX_LINES_HEALTHY:
         warnings.append(f"CLAUDE.md is large ({line_count} lines). Consider /refactor-claude")
 
-    # Check instruction density
-    instruction_count = count_instructions(content)
+    # Check instruction density. At most one instruction per line, so files
+    # shorter than the budget can't exceed it and skip the scan entirely.
+    if line_count <= MAX_INSTRUCTIONS_HEALTHY:
+        instruction_count = 0
+    else:
+        instruction_count = count_instructions(content)
     if instruction_count > MAX_INSTRUCTIONS_HEALTHY:
         warnings.append(
             f"Approaching instruction budget ({instruction_count} estimated). Consider consolidating"
@@ -224,35 +223,29 @@ def main() -> None:
     Non-blocking - always returns success, just injects warnings.
     Skips silently if CLAUDE.md doesn't exist or can't be read.
     """
-    raw = read_stdin_safe()
-    data = parse_hook_input(raw)
+    data = read_hook_input()
 
     # Skip for subagents - they don't need CLAUDE.md health checks
-    agent_type = get_nested(data, "agent_type", default=None)
-    if agent_type:
+    if data.get("agent_type"):
         return output_empty()
 
     # Get working directory from hook input
-    cwd = get_nested(data, "cwd", default=".")
-    cwd_path = Path(cwd)
+    cwd_path = Path(data.get("cwd") or ".")
     claudemd_path = cwd_path / "CLAUDE.md"
 
-    # Skip if CLAUDE.md doesn't exist
-    if not claudemd_path.exists():
+    # Skip if CLAUDE.md doesn't exist or can't be read
+    try:
+        content = claudemd_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
         return output_empty()
+    line_count = content.count("\n") + 1
 
     # Analyze and collect warnings
-    warnings = analyze_claudemd(claudemd_path)
+    warnings = analyze_claudemd(content, line_count)
 
     # Check for nested CLAUDE.md opportunities if file is large
-    try:
-        content = claudemd_path.read_text(encoding="utf-8")
-        line_count = len(content.split("\n"))
-        if line_count > MAX_LINES_HEALTHY:
-            nested_suggestions = detect_nested_opportunities(cwd_path, content)
-            warnings.extend(nested_suggestions)
-    except (OSError, UnicodeDecodeError):
-        pass  # Skip nested check if file can't be read
+    if line_count > MAX_LINES_HEALTHY:
+        warnings.extend(detect_nested_opportunities(cwd_path, content))
 
     # Output warnings if any found
     if warnings:
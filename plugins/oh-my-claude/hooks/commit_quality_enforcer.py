@@ -16,6 +16,7 @@ Intercepts `git commit` commands and validates:
 from __future__ import annotations
 
 import json
+import os
 import re
 import subprocess
 import sys
@@ -55,11 +56,42 @@ FORBIDDEN_PATTERNS = [
     re.compile(r'\U0001F916'),
 ]
 
+# HEREDOC commit message, searched before any plain -m so that
+# `-m "subject" -m "$(cat <<'EOF' ...)"` still yields the full message:
+#   -m "$(cat <<'EOF' ... EOF )"   -m '$(cat <<EOF ... EOF )'
+HEREDOC_MESSAGE_REGEX = re.compile(
+    r"""-m\s+(?:"\$\(cat\s+<<['"]?EOF['"]?\s*\n(.+?)\nEOF\s*\)\""""
+    r"""|'\$\(cat\s+<<['"]?EOF['"]?\s*\n(.+?)\nEOF\s*\)')""",
+    re.DOTALL,
+)
+
+# Plain quoted commit message: -m "message" or -m 'message'
+QUOTED_MESSAGE_REGEX = re.compile(r"""-m\s+(?:"(.+?)"|'(.+?)')""", re.DOTALL)
+
+# Matches an actual `git commit` invocation
+GIT_COMMIT_REGEX = re.compile(r"\bgit\s+commit\b")
+
+# `git diff --shortstat` summary, e.g.
+# " 3 files changed, 10 insertions(+), 2 deletions(-)"
+SHORTSTAT_REGEX = re.compile(
+    r"(\d+) files? changed(?:, (\d+) insertions?\(\+\))?(?:, (\d+) deletions?\(-\))?"
+)
+
+# Body lines required for large (200+ line) changes, the strictest tier
+LARGE_CHANGE_BODY_LINES = 4
+
+
+# Fixed response envelope; only the reason string needs JSON escaping
+DENY_TEMPLATE = '{"decision":"block","reason":%s}'
+
 
 def output_deny(reason: str) -> None:
-    """Output denial response for PreToolUse hook."""
-    response = {"decision": "block", "reason": reason}
-    print(json.dumps(response))
+    """Output denial response for PreToolUse hook.
+
+    The payload is ASCII (json.dumps escapes the reason), so it is written
+    to the binary buffer directly rather than through print().
+    """
+    sys.stdout.buffer.write((DENY_TEMPLATE % json.dumps(reason) + "\n").encode())
     sys.exit(0)
 
 
@@ -67,38 +99,31 @@ def get_staged_diff_stats() -> tuple[int, int]:
     """
     Get statistics about staged changes.
 
+    Uses the single-line --shortstat summary so the cost is independent of
+    how many files are staged.
+
     Returns:
         Tuple of (lines_changed, files_changed)
     """
     try:
-        # Get number of lines changed
         result = subprocess.run(
-            ["git", "diff", "--cached", "--numstat"],
+            ["git", "diff", "--cached", "--shortstat"],
             capture_output=True,
             text=True,
             timeout=5,
+            # Summary wording is translated; pin it so SHORTSTAT_REGEX matches
+            env={**os.environ, "LC_ALL": "C"},
         )
 
         if result.returncode != 0:
             return 0, 0
 
-        lines_added = 0
-        lines_deleted = 0
-        files_changed = 0
-
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                continue
-            parts = line.split("\t")
-            if len(parts) >= 2:
-                files_changed += 1
-                # Handle binary files (shown as -)
-                if parts[0] != "-":
-                    lines_added += int(parts[0])
-                if parts[1] != "-":
-                    lines_deleted += int(parts[1])
+        match = SHORTSTAT_REGEX.search(result.stdout)
+        if not match:
+            return 0, 0
 
-        return lines_added + lines_deleted, files_changed
+        files, insertions, deletions = (int(g or 0) for g in match.groups())
+        return insertions + deletions, files
 
     except (subprocess.TimeoutExpired, subprocess.SubprocessError, ValueError):
         return 0, 0
@@ -113,27 +138,11 @@ def extract_commit_message(command: str) -> str | None:
     - git commit -m 'message'
     - git commit -m "$(cat <<'EOF'\nmessage\nEOF\n)"
     """
-    # HEREDOC patterns first (more specific, must match before simple pattern)
-
-    # Pattern for HEREDOC: -m "$(cat <<'EOF' ... EOF )"
-    heredoc_pattern = r'-m\s+"\$\(cat\s+<<[\'"]?EOF[\'"]?\s*\n(.+?)\nEOF\s*\)"'
-    match = re.search(heredoc_pattern, command, re.DOTALL)
-    if match:
-        return match.group(1)
-
-    # Alternative HEREDOC without quotes
-    heredoc_pattern2 = r"-m\s+'\$\(cat\s+<<['\"]?EOF['\"]?\s*\n(.+?)\nEOF\s*\)'"
-    match = re.search(heredoc_pattern2, command, re.DOTALL)
-    if match:
-        return match.group(1)
-
-    # Simple pattern for -m "message" or -m 'message' (AFTER heredoc)
-    simple_pattern = r'-m\s+["\'](.+?)["\']'
-    match = re.search(simple_pattern, command, re.DOTALL)
-    if match:
-        return match.group(1)
-
-    return None
+    match = HEREDOC_MESSAGE_REGEX.search(command) or QUOTED_MESSAGE_REGEX.search(command)
+    if not match:
+        return None
+    # Exactly one alternative participates in a match
+    return next(group for group in match.groups() if group is not None)
 
 
 def validate_message_format(message: str) -> tuple[bool, list[str]]:
@@ -182,13 +191,12 @@ def validate_message_format(message: str) -> tuple[bool, list[str]]:
                 )
 
     # Check conventional commit format
-    if first_content_line:
-        if not CONVENTIONAL_COMMIT_REGEX.match(first_content_line):
-            errors.append(
-                "Subject must use conventional commit format: "
-                "<type>[scope]: <description>\n"
-                "Examples: feat: add feature, fix(auth): resolve bug"
-            )
+    if first_content_line and not CONVENTIONAL_COMMIT_REGEX.match(first_content_line):
+        errors.append(
+            "Subject must use conventional commit format: "
+            "<type>[scope]: <description>\n"
+            "Examples: feat: add feature, fix(auth): resolve bug"
+        )
 
     # Check for forbidden AI attribution
     for pattern in FORBIDDEN_PATTERNS:
@@ -204,24 +212,15 @@ def validate_message_format(message: str) -> tuple[bool, list[str]]:
 
 def count_message_body_lines(message: str) -> int:
     """Count non-empty lines in the commit message body (after subject)."""
-    lines = message.strip().split("\n")
-
-    if len(lines) <= 1:
-        return 0
+    lines = iter(message.strip().splitlines())
 
-    # Skip subject line and blank line after it
-    body_lines = []
-    in_body = False
-
-    for i, line in enumerate(lines[1:], start=1):
-        if not in_body:
-            if line.strip() == "":
-                in_body = True
-            continue
-        if line.strip():
-            body_lines.append(line)
+    # Skip subject line and everything up to the blank line after it
+    next(lines, None)
+    for line in lines:
+        if not line.strip():
+            break
 
-    return len(body_lines)
+    return sum(1 for line in lines if line.strip())
 
 
 def evaluate_message_quality(
@@ -239,7 +238,7 @@ def evaluate_message_quality(
     subject = message.strip().split("\n")[0] if message else ""
 
     log_debug(
-        f"Evaluating: {lines_changed} lines, {files_changed} files, "
+        lambda: f"Evaluating: {lines_changed} lines, {files_changed} files, "
         f"{body_lines} body lines, subject: '{subject[:50]}...'"
     )
 
@@ -272,7 +271,7 @@ def evaluate_message_quality(
         return True, ""
 
     # Large changes (200+ lines): need detailed explanation
-    if body_lines < 4:
+    if body_lines < LARGE_CHANGE_BODY_LINES:
         return False, (
             f"This commit changes {lines_changed} lines across {files_changed} file(s). "
             f"Large changes require detailed commit messages. Include:\n"
@@ -290,6 +289,13 @@ def evaluate_message_quality(
 def main() -> None:
     """Main hook entry point."""
     raw = read_stdin_safe()
+
+    # Most PreToolUse events aren't commits; skip decoding their payload.
+    # False positives fall through to the checks below.
+    if "commit" not in raw:
+        output_empty()
+        return
+
     data = parse_hook_input(raw)
 
     tool_name = data.get("tool_name", "")
@@ -302,12 +308,13 @@ def main() -> None:
     tool_input = data.get("tool_input", {})
     command = tool_input.get("command", "")
 
-    # Only intercept git commit commands
-    if not re.search(r"\bgit\s+commit\b", command):
+    # Only intercept git commit commands (substring check skips the regex
+    # for the vast majority of Bash calls)
+    if "commit" not in command or not GIT_COMMIT_REGEX.search(command):
         output_empty()
         return
 
-    log_debug(f"Intercepted git commit: {command[:100]}...")
+    log_debug(lambda: f"Intercepted git commit: {command[:100]}...")
 
     # Skip if this is --amend without a new message (editing existing)
     if "--amend" in command and "-m" not in command:
@@ -327,7 +334,7 @@ def main() -> None:
     format_valid, format_errors = validate_message_format(message)
 
     if not format_valid:
-        log_debug(f"Denying commit - format errors: {format_errors}")
+        log_debug(lambda: f"Denying commit - format errors: {format_errors}")
         error_list = "\n".join(f"• {e}" for e in format_errors)
         output_deny(
             f"[Commit Format Validation Failed]\n\n{error_list}\n\n"
@@ -335,6 +342,12 @@ def main() -> None:
         )
         return
 
+    # A body this detailed satisfies every size tier, so skip spawning git
+    if count_message_body_lines(message) >= LARGE_CHANGE_BODY_LINES:
+        log_debug("Detailed commit body, skipping diff stats")
+        output_empty()
+        return
+
     # Get diff statistics for quality evaluation
     lines_changed, files_changed = get_staged_diff_stats()
 
@@ -349,7 +362,7 @@ def main() -> None:
     )
 
     if not is_acceptable:
-        log_debug(f"Denying commit: {reason[:100]}...")
+        log_debug(lambda: f"Denying commit: {reason[:100]}...")
         output_deny(
             f"[Commit Quality Check Failed]\n\n{reason}\n\n"
             f"Rewrite the commit message with more detail and try again."
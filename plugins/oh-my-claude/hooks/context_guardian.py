@@ -13,11 +13,13 @@ For subagents (when agent_type is set), we skip the SOP since:
 - Their agent .md file provides specific guidance
 """
 
+import json
+import sys
+
 from hook_utils import (
     get_nested,
     hook_main,
     is_teams_enabled,
-    output_context,
     output_empty,
     parse_hook_input,
     read_stdin_safe,
@@ -169,6 +171,24 @@ When creating agent teams:
 Your value is in ORCHESTRATION. Let teams and agents do the work."""
 
 
+# Fixed response envelope; only the context string needs JSON escaping
+CONTEXT_TEMPLATE = (
+    '{"hookSpecificOutput":{"hookEventName":"SessionStart",'
+    '"additionalContext":%s}}\n'
+)
+
+
+def encode_context(context: str) -> bytes:
+    """Encode a SessionStart additionalContext response as UTF-8 JSON.
+
+    The SOP text is several KB of mostly ASCII; skipping ensure_ascii and
+    writing bytes straight to stdout avoids escaping it and a second pass
+    through the text I/O layer.
+    """
+    encoded = json.dumps(context, ensure_ascii=False)
+    return (CONTEXT_TEMPLATE % encoded).encode("utf-8")
+
+
 @hook_main("SessionStart")
 def main() -> None:
     """Inject context protection instructions at session start.
@@ -188,10 +208,8 @@ def main() -> None:
         return output_empty()
 
     # Main session - inject SOP based on teams availability
-    if is_teams_enabled():
-        output_context("SessionStart", TEAM_LEAD_CONTEXT)
-    else:
-        output_context("SessionStart", SOLO_CONTEXT)
+    context = TEAM_LEAD_CONTEXT if is_teams_enabled() else SOLO_CONTEXT
+    sys.stdout.buffer.write(encode_context(context))
 
 
 if __name__ == "__main__":
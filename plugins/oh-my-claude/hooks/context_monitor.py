@@ -19,13 +19,14 @@ Configuration via environment variables:
 from __future__ import annotations
 
 import os
-from pathlib import Path
+import re
 import sys
 
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, os.path.dirname(__file__) or ".")
 
 from hook_utils import (
-    get_nested,
+    claim_marker,
+    has_marker,
     hook_main,
     log_debug,
     output_context,
@@ -39,8 +40,14 @@ CONTEXT_LIMIT = 200_000
 DEFAULT_WARNING_PCT = 70
 DEFAULT_CRITICAL_PCT = 85
 
-# Filesystem-based dedup directory
-_DEDUP_DIR = Path("/tmp")
+# Filesystem-based dedup markers (see hook_utils.MARKER_DIR)
+_MARKER_PREFIX = "omc_context_"
+
+# Native usage value as it appears in the raw hook JSON: the
+# used_percentage key of the flat context_window object
+NATIVE_PCT_REGEX = re.compile(
+    r'"context_window"\s*:\s*\{[^{}]*?"used_percentage"\s*:\s*(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)'
+)
 
 
 def get_warning_threshold() -> float:
@@ -63,41 +70,71 @@ def get_critical_threshold() -> float:
 
 def has_warned(session_id: str, threshold: str) -> bool:
     """Check if a warning has already been issued for this session/threshold."""
-    marker = _DEDUP_DIR / f"omc_context_{session_id}_{threshold}"
-    return marker.exists()
+    return has_marker(f"{_MARKER_PREFIX}{session_id}_{threshold}")
 
 
 def mark_warned(session_id: str, threshold: str) -> None:
-    """Record that a warning was issued for this session/threshold."""
-    marker = _DEDUP_DIR / f"omc_context_{session_id}_{threshold}"
-    try:
-        marker.touch()
-    except OSError:
-        pass
+    """Record that a warning was issued for this session/threshold.
+
+    claim_marker also sweeps stale markers from old sessions.
+    """
+    claim_marker(f"{_MARKER_PREFIX}{session_id}_{threshold}")
 
 
 def estimate_tokens(transcript: list) -> int:
-    """Approximate tokens from character count (~4 chars per token)."""
-    total_chars = sum(len(str(entry)) for entry in transcript)
+    """Approximate tokens from character count (~4 chars per token).
+
+    Sums the lengths of leaf values instead of str()-ing whole entries, so
+    large message dicts aren't re-serialized just to be measured. Keys and
+    punctuation are ignored as roughly constant overhead.
+    """
+    total_chars = 0
+    stack = [transcript]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            total_chars += len(node)
+        elif isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+        elif node is not None:
+            total_chars += len(str(node))
     return total_chars // 4
 
 
+def peek_native_percentage(raw: str) -> float | None:
+    """Read context_window.used_percentage from raw JSON without parsing it.
+
+    Returns None unless "context_window" appears exactly once (so tool
+    input/output can't supply the value) and holds a numeric
+    used_percentage; callers then fall back to the parsed input.
+    """
+    if raw.count('"context_window"') != 1:
+        return None
+    match = NATIVE_PCT_REGEX.search(raw)
+    if not match:
+        return None
+    return float(match.group(1)) / 100.0
+
+
 def get_usage_percentage(data: dict) -> float:
     """Get context usage as a decimal 0.0-1.0.
 
     Prefers native context_window.used_percentage, falls back to
     transcript-based estimation with a log_debug() call.
     """
-    native_pct = get_nested(data, "context_window", "used_percentage")
+    context_window = data.get("context_window")
+    native_pct = context_window.get("used_percentage") if isinstance(context_window, dict) else None
     if native_pct is not None:
         try:
             return float(native_pct) / 100.0
         except (TypeError, ValueError):
-            log_debug(f"invalid context_window.used_percentage: {native_pct}, falling back to estimation")
+            log_debug(lambda: f"invalid context_window.used_percentage: {native_pct}, falling back to estimation")
 
     # Fallback to transcript-based estimation
     log_debug("context_window.used_percentage not available, using transcript estimation")
-    transcript = get_nested(data, "transcript", default=[])
+    transcript = data.get("transcript")
     if not transcript:
         return 0.0
     estimated_tokens = estimate_tokens(transcript)
@@ -107,18 +144,31 @@ def get_usage_percentage(data: dict) -> float:
 @hook_main("PostToolUse")
 def main() -> None:
     raw = read_stdin_safe()
+
+    # Get thresholds from env vars
+    warning_threshold = get_warning_threshold()
+    critical_threshold = get_critical_threshold()
+    log_debug(lambda: f"thresholds: warn={warning_threshold:.0%}, critical={critical_threshold:.0%}")
+
+    # Common case: native usage is below the warning threshold, so there is
+    # nothing to do and the (possibly large) tool payload needn't be decoded
+    native_pct = peek_native_percentage(raw)
+    if native_pct is not None and native_pct < warning_threshold:
+        return output_empty()
+
     data = parse_hook_input(raw)
 
     if not data:
         return output_empty()
 
-    session_id = get_nested(data, "session_id", default="unknown")
-    usage_pct = get_usage_percentage(data)
+    session_id = data.get("session_id") or "unknown"
 
-    # Get thresholds from env vars
-    warning_threshold = get_warning_threshold()
-    critical_threshold = get_critical_threshold()
-    log_debug(f"thresholds: warn={warning_threshold:.0%}, critical={critical_threshold:.0%}")
+    # Once both warnings have fired nothing else can, so skip the usage
+    # calculation (transcript estimation can be expensive)
+    if has_warned(session_id, "critical") and has_warned(session_id, "warning"):
+        return output_empty()
+
+    usage_pct = get_usage_percentage(data)
 
     # Check thresholds (critical first, then warning)
     if usage_pct >= critical_threshold:
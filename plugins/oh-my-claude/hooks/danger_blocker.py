@@ -12,6 +12,7 @@ This hook now only handles warnings via additionalContext.
 Environment Variable: OMC_DANGER_BLOCK - default "1" (enabled). Set to "0" to disable.
 """
 
+import functools
 import json
 import re
 import sys
@@ -21,24 +22,46 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 from hook_utils import hook_main, log_debug, output_empty, parse_bool_env, parse_hook_input, read_stdin_safe
 
-# Warn patterns - warn via additionalContext but allow
+# Warn patterns - warn via additionalContext but allow.
+# Each pattern is anchored to a line start and commits atomically to the
+# first curl/wget on that line, so a long command with many candidates and
+# no shell pipe fails in linear time instead of retrying from every one.
+# Compile with re.MULTILINE.
 WARN_PATTERNS = [
-    (r'\bcurl\s+.*\|\s*(ba)?sh', "piping curl to shell executes remote code. Safe alternative: download first, inspect, then run"),
-    (r'\bwget\s+.*\|\s*(ba)?sh', "piping wget to shell executes remote code. Safe alternative: download first, inspect, then run"),
-    (r'\bwget\s+.*&&\s*(ba)?sh', "wget followed by shell execution of downloaded content. Safe alternative: download first, inspect, then run"),
-    (r'\bcurl\s+.*\|\s*base64\s+-d\s*\|\s*(ba)?sh', "piping curl through base64 decode to shell is obfuscated remote code execution. Safe alternative: download first, inspect, then run"),
+    (r'^(?>[^\n]*?\bcurl\s+)[^\n]*\|\s*(?:ba)?sh\b', "piping curl to shell executes remote code. Safe alternative: download first, inspect, then run"),
+    (r'^(?>[^\n]*?\bwget\s+)[^\n]*\|\s*(?:ba)?sh\b', "piping wget to shell executes remote code. Safe alternative: download first, inspect, then run"),
+    (r'^(?>[^\n]*?\bwget\s+)[^\n]*&&\s*(?:ba)?sh\b', "wget followed by shell execution of downloaded content. Safe alternative: download first, inspect, then run"),
+    (r'^(?>[^\n]*?\bcurl\s+)[^\n]*\|\s*base64\s+-d\s*\|\s*(?:ba)?sh\b', "piping curl through base64 decode to shell is obfuscated remote code execution. Safe alternative: download first, inspect, then run"),
 ]
 
+# Every warn pattern requires one of these words; commands without any of
+# them skip the regex entirely.
+WARN_LITERALS = ("curl", "wget")
+
+# All warn patterns fused into one alternation so a command is scanned once;
+# the matching group's name maps back to its reason.
+WARN_REASONS = {f"warn{i}": reason for i, (_, reason) in enumerate(WARN_PATTERNS)}
+
+# Fixed response envelope; only the warning text needs JSON escaping
+WARN_TEMPLATE = '{"hookSpecificOutput":{"hookEventName":"PreToolUse","additionalContext":%s}}'
+
+
+@functools.cache
+def warn_regex() -> re.Pattern[str]:
+    """Compile the fused warn regex on first use.
+
+    Most commands fail the literal prefilter, so their hook process never
+    compiles it.
+    """
+    return re.compile(
+        "|".join(f"(?P<warn{i}>{pattern})" for i, (pattern, _) in enumerate(WARN_PATTERNS)),
+        re.IGNORECASE | re.MULTILINE,
+    )
+
 
 def output_warn(message: str) -> None:
     """Warn but allow - injects warning into Claude's context."""
-    response = {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "additionalContext": f"WARNING: SECURITY WARNING: {message}. Proceed with caution."
-        }
-    }
-    print(json.dumps(response))
+    print(WARN_TEMPLATE % json.dumps(f"WARNING: SECURITY WARNING: {message}. Proceed with caution."))
     sys.exit(0)
 
 
@@ -67,14 +90,20 @@ def main() -> None:
         output_empty()
         return
 
-    log_debug(f"Checking command: {command[:100]}...")
+    log_debug(lambda: f"Checking command: {command[:100]}...")
 
     # Check warn patterns (allow with warning)
-    for pattern, reason in WARN_PATTERNS:
-        if re.search(pattern, command, re.IGNORECASE):
-            log_debug(f"WARNING: {reason}")
-            output_warn(reason)
-            return
+    lowered = command.lower()
+    if not any(literal in lowered for literal in WARN_LITERALS):
+        output_empty()
+        return
+
+    match = warn_regex().search(command)
+    if match:
+        reason = WARN_REASONS[match.lastgroup]
+        log_debug(lambda: f"WARNING: {reason}")
+        output_warn(reason)
+        return
 
     # Safe - allow through
     output_empty()
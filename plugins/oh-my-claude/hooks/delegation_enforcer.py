@@ -12,6 +12,8 @@ Provides context reminder (not hard block) encouraging delegation to subagents.
 
 from __future__ import annotations
 
+import functools
+import re
 import sys
 from pathlib import Path
 
@@ -37,8 +39,16 @@ EXECUTION_MARKERS = [
     "implement the following plan",
 ]
 
+# Task-tracking references that also indicate execution mode
+TASK_MARKERS = ["tasklist", "pending task"]
+
 # Escape hatch marker
 DIRECT_MARKER = "[direct]"
+DIRECT_REGEX = re.compile(re.escape(DIRECT_MARKER), re.IGNORECASE)
+
+# Fields that may carry the marker; Edit sizes new_string, Write sizes content
+DIRECT_FIELDS = ("old_string", "new_string", "content", "file_path")
+SIZED_FIELDS = frozenset({"new_string", "content"})
 
 # Threshold for "short" file changes (lines)
 SHORT_CHANGE_THRESHOLD = 20
@@ -69,35 +79,42 @@ Consider delegating via teammates or subagents:
 Add [DIRECT] to proceed without delegation."""
 
 
-def has_direct_marker(tool_input: dict) -> bool:
-    """Check if [DIRECT] escape hatch is present in tool input."""
-    # Check various fields that might contain the marker
-    for field in ["old_string", "new_string", "content", "file_path"]:
-        value = tool_input.get(field, "")
-        if isinstance(value, str) and DIRECT_MARKER in value.lower():
-            return True
-    return False
-
-
-def is_short_change(tool_input: dict) -> bool:
-    """Check if the change is under the threshold (lightweight edit)."""
-    # For Edit tool, check new_string length
-    new_string = tool_input.get("new_string", "")
-    if new_string:
-        line_count = new_string.count("\n") + 1
-        if line_count < SHORT_CHANGE_THRESHOLD:
-            log_debug(f"short change detected: {line_count} lines")
-            return True
-
-    # For Write tool, check content length
-    content = tool_input.get("content", "")
-    if content:
-        line_count = content.count("\n") + 1
-        if line_count < SHORT_CHANGE_THRESHOLD:
-            log_debug(f"short write detected: {line_count} lines")
-            return True
-
-    return False
+def scan_tool_input(tool_input: dict) -> tuple[bool, bool]:
+    """Check the [DIRECT] escape hatch and change size in one pass.
+
+    Returns:
+        (has_direct, is_short): whether any field carries the [DIRECT]
+        marker, and whether new_string or content is under
+        SHORT_CHANGE_THRESHOLD lines.
+    """
+    has_direct = False
+    is_short = False
+    for field in DIRECT_FIELDS:
+        value = tool_input.get(field)
+        if not value or not isinstance(value, str):
+            continue
+        if not has_direct and DIRECT_REGEX.search(value):
+            has_direct = True
+        if not is_short and field in SIZED_FIELDS:
+            line_count = value.count("\n") + 1
+            if line_count < SHORT_CHANGE_THRESHOLD:
+                log_debug(lambda field=field, lines=line_count: f"short {field} detected: {lines} lines")
+                is_short = True
+    return has_direct, is_short
+
+
+@functools.cache
+def execution_regex() -> re.Pattern[str]:
+    """Compile all markers into one case-insensitive alternation on first use.
+
+    One pass over each text source replaces lowering a copy of the
+    transcript and scanning it once per marker. Short and [DIRECT] edits
+    return before this is ever compiled.
+    """
+    return re.compile(
+        "|".join(re.escape(marker) for marker in EXECUTION_MARKERS + TASK_MARKERS),
+        re.IGNORECASE,
+    )
 
 
 def is_execution_mode(data: dict) -> bool:
@@ -107,21 +124,15 @@ def is_execution_mode(data: dict) -> bool:
     transcript = get_nested(data, "transcript", default="")
     prompt = get_nested(data, "prompt", default="")
 
-    # Combine available text sources
-    context_text = f"{transcript} {prompt}".lower()
-
-    for marker in EXECUTION_MARKERS:
-        if marker in context_text:
-            log_debug(f"execution mode detected via marker: {marker}")
+    for text in (transcript, prompt):
+        # Structured transcripts (lists of message dicts) are searched as text
+        if not isinstance(text, str):
+            text = str(text)
+        match = execution_regex().search(text)
+        if match:
+            log_debug(lambda match=match: f"execution mode detected via marker: {match.group(0).lower()}")
             return True
 
-    # Check if there are pending tasks (indicates active task tracking)
-    # Note: We can't directly query TaskList from a hook, but the presence
-    # of task-related context in the input might indicate this
-    if "tasklist" in context_text or "pending task" in context_text:
-        log_debug("execution mode detected via task references")
-        return True
-
     return False
 
 
@@ -134,28 +145,31 @@ def main() -> None:
         output_empty()
         return
 
-    # Skip for agent sessions (subagents and teammates implement freely)
-    if is_agent_session(data):
-        return output_empty()
-
-    tool_name = get_nested(data, "tool_name", default="")
-    tool_input = get_nested(data, "tool_input", default={})
+    tool_name = data.get("tool_name") or ""
 
-    log_debug(f"tool_name={tool_name}")
+    log_debug(lambda: f"tool_name={tool_name}")
 
     # Only process Edit and Write tools
     if tool_name not in ("Edit", "Write"):
         output_empty()
         return
 
+    # Skip for agent sessions (subagents and teammates implement freely)
+    if is_agent_session(data):
+        return output_empty()
+
+    tool_input = data.get("tool_input") or {}
+
+    has_direct, is_short = scan_tool_input(tool_input)
+
     # Escape hatch: [DIRECT] marker present
-    if has_direct_marker(tool_input):
+    if has_direct:
         log_debug("direct marker found, skipping reminder")
         output_empty()
         return
 
     # Escape hatch: short changes get no guidance
-    if is_short_change(tool_input):
+    if is_short:
         log_debug("short change, skipping reminder")
         output_empty()
         return
@@ -170,7 +184,7 @@ def main() -> None:
     # Team leads get a softer message mentioning teammate delegation
     session_ctx = get_session_context(data)
     reminder = TEAM_LEAD_REMINDER if session_ctx == "team_lead" else DELEGATION_REMINDER
-    log_debug(f"showing delegation reminder (session_context={session_ctx})")
+    log_debug(lambda: f"showing delegation reminder (session_context={session_ctx})")
     output_context("PreToolUse", reminder)
 
 
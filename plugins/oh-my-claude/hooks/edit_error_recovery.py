@@ -9,7 +9,6 @@ PostToolUse hook: Detects Edit tool failures and injects recovery guidance.
 """
 
 from pathlib import Path
-import re
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent))
@@ -23,12 +22,12 @@ from hook_utils import (
     read_stdin_safe,
 )
 
-# Error patterns to detect (case insensitive)
-ERROR_PATTERNS = [
-    re.compile(r"old_string not found", re.IGNORECASE),
-    re.compile(r"old_string found multiple times", re.IGNORECASE),
-    re.compile(r"old_string and new_string must be different", re.IGNORECASE),
-]
+# Error phrases to detect (lowercase; matched case-insensitively)
+ERROR_PATTERNS = (
+    "old_string not found",
+    "old_string found multiple times",
+    "old_string and new_string must be different",
+)
 
 RECOVERY_MESSAGE = """[Edit Error Recovery]
 
@@ -51,10 +50,8 @@ Common causes:
 
 def has_edit_error(tool_output: str) -> bool:
     """Check if tool output contains any known edit error patterns."""
-    for pattern in ERROR_PATTERNS:
-        if pattern.search(tool_output):
-            return True
-    return False
+    lowered = tool_output.lower()
+    return any(pattern in lowered for pattern in ERROR_PATTERNS)
 
 
 @hook_main("PostToolUse")
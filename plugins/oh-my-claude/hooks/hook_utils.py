@@ -8,6 +8,7 @@ Uses only Python stdlib - no external dependencies.
 from __future__ import annotations
 
 import functools
+import gc
 import json
 import os
 import re
@@ -15,6 +16,7 @@ import select
 import shutil
 import signal
 import sys
+import time
 from typing import Any, Callable, TypeVar
 
 # =============================================================================
@@ -24,6 +26,12 @@ from typing import Any, Callable, TypeVar
 MAX_STDIN_BYTES: int = 1_000_000  # 1MB
 STDIN_TIMEOUT_SECONDS: int = 5
 
+# Hook output is machine-read; skip json.dumps' default ", " / ": " padding
+COMPACT_SEPARATORS: tuple[str, str] = (",", ":")
+
+# Fixed additionalContext envelope; only the two string values need escaping
+CONTEXT_TEMPLATE = '{"hookSpecificOutput":{"hookEventName":%s,"additionalContext":%s}}'
+
 # =============================================================================
 # Logging (stderr only)
 # =============================================================================
@@ -31,9 +39,16 @@ STDIN_TIMEOUT_SECONDS: int = 5
 DEBUG: bool = os.environ.get("HOOK_DEBUG", "").lower() in ("1", "true", "yes")
 
 
-def log_debug(msg: str) -> None:
-    """Log debug message to stderr if DEBUG is enabled."""
+def log_debug(msg: str | Callable[[], str]) -> None:
+    """Log debug message to stderr if DEBUG is enabled.
+
+    Interpolated messages are always passed as a zero-argument callable
+    (``lambda: f"..."``) so they are only formatted when debugging is on.
+    Inside loops, bind loop variables as defaults (``lambda x=x: ...``).
+    """
     if DEBUG:
+        if callable(msg):
+            msg = msg()
         print(f"[DEBUG] {msg}", file=sys.stderr)
 
 
@@ -116,7 +131,7 @@ def read_stdin_safe(
             return ""
     except (ValueError, OSError) as e:
         # stdin might not be selectable (e.g., redirected file)
-        log_debug(f"select() failed: {e}, falling back to SIGALRM")
+        log_debug(lambda: f"select() failed: {e}, falling back to SIGALRM")
         readable = True  # Proceed with SIGALRM backup
 
     # Set up SIGALRM as backup timeout mechanism
@@ -124,13 +139,15 @@ def read_stdin_safe(
     signal.alarm(timeout)
 
     try:
-        content = sys.stdin.read(max_bytes + 1)
+        # Read raw bytes and decode once: skips the text layer's incremental
+        # decoding and makes max_bytes a true byte limit.
+        content = sys.stdin.buffer.read(max_bytes + 1)
 
         if len(content) > max_bytes:
             raise StdinSizeError(f"stdin exceeds {max_bytes} bytes")
 
-        log_debug(f"read {len(content)} bytes from stdin")
-        return content
+        log_debug(lambda: f"read {len(content)} bytes from stdin")
+        return content.decode("utf-8", errors="replace")
 
     except StdinTimeoutError:
         log_debug("stdin read timed out via SIGALRM")
@@ -163,14 +180,28 @@ def parse_hook_input(raw: str) -> dict[str, Any]:
     try:
         data = json.loads(raw)
         if not isinstance(data, dict):
-            log_debug(f"parsed JSON is not a dict: {type(data)}")
+            log_debug(lambda: f"parsed JSON is not a dict: {type(data)}")
             return {}
         return data
     except json.JSONDecodeError as e:
-        log_debug(f"JSON parse error: {e}")
+        log_debug(lambda: f"JSON parse error: {e}")
         return {}
 
 
+@functools.cache
+def read_hook_input() -> dict[str, Any]:
+    """
+    Read and parse hook input from stdin, at most once per process.
+
+    stdin can only be consumed once, so later calls return the same dict
+    instead of re-reading an exhausted stream and getting {}.
+
+    Returns:
+        Parsed dictionary, or empty dict on empty/invalid input.
+    """
+    return parse_hook_input(read_stdin_safe())
+
+
 def get_nested(data: dict[str, Any], *keys: str, default: Any = None) -> Any:
     """
     Safely access nested dictionary values.
@@ -217,13 +248,7 @@ def output_context(hook_event: str, context: str) -> None:
         hook_event: The hook event name (e.g., "UserPromptSubmit").
         context: Additional context to inject.
     """
-    response = {
-        "hookSpecificOutput": {
-            "hookEventName": hook_event,
-            "additionalContext": context,
-        }
-    }
-    print(json.dumps(response))
+    print(CONTEXT_TEMPLATE % (json.dumps(hook_event), json.dumps(context)))
 
 
 def output_block(hook_event: str, reason: str, context: str) -> None:
@@ -243,7 +268,7 @@ def output_block(hook_event: str, reason: str, context: str) -> None:
             "additionalContext": context,
         }
     }
-    print(json.dumps(response))
+    print(json.dumps(response, separators=COMPACT_SEPARATORS))
 
 
 def output_stop_block(reason: str, context: str | None = None) -> None:
@@ -262,7 +287,7 @@ def output_stop_block(reason: str, context: str | None = None) -> None:
         "decision": "block",
         "reason": stop_reason,
     }
-    print(json.dumps(response))
+    print(json.dumps(response, separators=COMPACT_SEPARATORS))
 
 
 def output_permission(decision: str, reason: str | None = None) -> None:
@@ -276,7 +301,7 @@ def output_permission(decision: str, reason: str | None = None) -> None:
     response: dict[str, Any] = {"permissionDecision": decision}
     if reason:
         response["reason"] = reason
-    print(json.dumps(response))
+    print(json.dumps(response, separators=COMPACT_SEPARATORS))
 
 
 def output_subagent_decision(decision: str, reason: str | None = None) -> None:
@@ -291,7 +316,7 @@ def output_subagent_decision(decision: str, reason: str | None = None) -> None:
     response: dict[str, Any] = {"decision": decision}
     if reason:
         response["reason"] = reason
-    print(json.dumps(response))
+    print(json.dumps(response, separators=COMPACT_SEPARATORS))
 
 
 def output_pretooluse_modify(updated_input: dict[str, Any], reason: str | None = None) -> None:
@@ -314,7 +339,7 @@ def output_pretooluse_modify(updated_input: dict[str, Any], reason: str | None =
     if reason:
         hook_output["permissionDecisionReason"] = reason
     response = {"hookSpecificOutput": hook_output}
-    print(json.dumps(response))
+    print(json.dumps(response, separators=COMPACT_SEPARATORS))
 
 
 # =============================================================================
@@ -328,8 +353,9 @@ def hook_main(hook_event: str) -> Callable[[F], F]:
     """
     Decorator for hook main functions with error handling.
 
-    Sets DEBUG from HOOK_DEBUG env var, wraps function with try/except,
-    and calls output_empty() on any unhandled exception.
+    Sets DEBUG from HOOK_DEBUG env var, disables the cyclic garbage
+    collector when the hook runs as a script, wraps function with
+    try/except, and calls output_empty() on any unhandled exception.
 
     Args:
         hook_event: The hook event name for error context.
@@ -347,6 +373,12 @@ def hook_main(hook_event: str) -> Callable[[F], F]:
             global DEBUG
             DEBUG = os.environ.get("HOOK_DEBUG", "").lower() in ("1", "true", "yes")
 
+            # Hook processes live for milliseconds and free everything on
+            # exit, so cyclic GC passes are pure overhead. Only touch the
+            # collector when running as a script, never when imported.
+            if func.__module__ == "__main__":
+                gc.disable()
+
             try:
                 return func(*args, **kwargs)
             except SystemExit:
@@ -370,10 +402,12 @@ class RegexCache:
     """
     Cache for compiled regular expressions.
 
-    Avoids recompiling the same patterns repeatedly.
+    Patterns are compiled on first use, so a hook that registers many
+    patterns only pays for the ones it actually evaluates in this process.
     """
 
     def __init__(self) -> None:
+        self._sources: dict[str, tuple[str, int]] = {}
         self._patterns: dict[str, re.Pattern[str]] = {}
 
     def add(self, name: str, pattern: str, flags: int = 0) -> None:
@@ -385,7 +419,8 @@ class RegexCache:
             pattern: Regular expression string.
             flags: re module flags (e.g., re.IGNORECASE).
         """
-        self._patterns[name] = re.compile(pattern, flags)
+        self._sources[name] = (pattern, flags)
+        self._patterns.pop(name, None)
 
     def match(self, name: str, text: str) -> re.Match[str] | None:
         """
@@ -401,17 +436,20 @@ class RegexCache:
         Raises:
             KeyError: If pattern name not found.
         """
-        if name not in self._patterns:
-            raise KeyError(f"pattern '{name}' not in cache")
-        return self._patterns[name].search(text)
+        compiled = self._patterns.get(name)
+        if compiled is None:
+            if name not in self._sources:
+                raise KeyError(f"pattern '{name}' not in cache")
+            compiled = self._patterns[name] = re.compile(*self._sources[name])
+        return compiled.search(text)
 
     def names(self) -> list[str]:
         """Return all registered pattern names."""
-        return list(self._patterns.keys())
+        return list(self._sources.keys())
 
     def has(self, name: str) -> bool:
         """Check if a pattern is cached."""
-        return name in self._patterns
+        return name in self._sources
 
 
 class WhichCache:
@@ -500,3 +538,65 @@ def get_session_context(data: dict[str, Any]) -> str:
     if is_teams_enabled():
         return "team_lead"
     return "solo"
+
+
+# =============================================================================
+# Session markers
+# =============================================================================
+
+# Each hook event is a fresh process, so per-session state ("already
+# warned", "already reminded") lives in marker files. TMPDIR is honoured
+# like tempfile.gettempdir(), without importing tempfile on every hook.
+MARKER_DIR: str = os.environ.get("TMPDIR") or "/tmp"
+
+# Every plugin marker name starts with this; markers older than
+# MARKER_MAX_AGE_SECONDS belong to finished sessions and are swept
+MARKER_PREFIX = "omc_"
+MARKER_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+
+def marker_path(name: str) -> str:
+    """Return the path of the named marker file."""
+    return os.path.join(MARKER_DIR, name)
+
+
+def has_marker(name: str) -> bool:
+    """Check whether the named marker file exists."""
+    return os.path.exists(marker_path(name))
+
+
+def claim_marker(name: str) -> bool:
+    """Create the named marker, returning False if it already existed.
+
+    O_EXCL makes the check and the write one atomic open, so concurrent
+    hook processes cannot both claim the same marker. If the marker can't
+    be written at all, returns True so callers fail open.
+
+    Creating a marker is rare (a few times per session), so it is also
+    when stale markers from old sessions are cleaned up.
+    """
+    try:
+        os.close(os.open(marker_path(name), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+    except FileExistsError:
+        return False
+    except OSError:
+        return True
+    sweep_stale_markers()
+    return True
+
+
+def sweep_stale_markers() -> None:
+    """Delete plugin markers older than MARKER_MAX_AGE_SECONDS."""
+    cutoff = time.time() - MARKER_MAX_AGE_SECONDS
+    try:
+        with os.scandir(MARKER_DIR) as entries:
+            for entry in entries:
+                if not entry.name.startswith(MARKER_PREFIX):
+                    continue
+                try:
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
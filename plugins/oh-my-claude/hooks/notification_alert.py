@@ -34,6 +34,69 @@ def _sanitize_powershell(value: str) -> str:
     return value.replace("'", "''")
 
 
+# PowerShell startup is dominated by loading user profiles; the toast and
+# balloon scripts need neither a profile nor an interactive host
+POWERSHELL_FLAGS = ("-NoProfile", "-NonInteractive")
+
+# Linux notifiers in order of preference
+LINUX_NOTIFIERS = ("notify-send", "zenity", "kdialog")
+
+
+def _notifier_cache_file() -> str:
+    """Path of the file remembering which Linux notifier to use."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "oh-my-claude", "notifier")
+
+
+def _detect_linux_notifier() -> tuple[str, str] | None:
+    """Probe for a notifier: ("wsl", "") under WSL, else (name, path)."""
+    try:
+        version_info = Path("/proc/version").read_text().lower()
+        if "microsoft" in version_info or "wsl" in version_info:
+            return "wsl", ""
+    except Exception:
+        pass
+
+    for name in LINUX_NOTIFIERS:
+        path = shutil.which(name)
+        if path:
+            return name, path
+    return None
+
+
+def resolve_linux_notifier() -> str | None:
+    """Return "wsl" or a notifier name from LINUX_NOTIFIERS, or None.
+
+    The result is cached on disk, so later events only check that the
+    cached binary is still executable instead of re-reading /proc/version
+    and scanning PATH for each candidate. A missing notifier is not
+    cached, so installing one later is picked up.
+    """
+    cache_file = _notifier_cache_file()
+    try:
+        with open(cache_file) as f:
+            name, _, path = f.read().strip().partition(" ")
+        if name == "wsl" or (name in LINUX_NOTIFIERS and os.access(path, os.X_OK)):
+            return name
+    except OSError:
+        pass
+
+    detected = _detect_linux_notifier()
+    if detected is None:
+        return None
+
+    name, path = detected
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}"
+        with open(tmp_file, "w") as f:
+            f.write(f"{name} {path}\n")
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        log_debug(lambda: f"Could not cache notifier: {e}")
+    return name
+
+
 def get_notifier_command(title: str, message: str) -> list[str] | None:
     """Get platform-appropriate notification command."""
 
@@ -59,39 +122,33 @@ def get_notifier_command(title: str, message: str) -> list[str] | None:
         $toast = [Windows.UI.Notifications.ToastNotification]::new($xml)
         [Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("Claude Code").Show($toast)
         '''
-        return ["powershell", "-Command", ps_script]
+        return ["powershell", *POWERSHELL_FLAGS, "-Command", ps_script]
 
     else:
-        # Linux/BSD - check for common notifiers
-        # First check if WSL
-        try:
-            version_info = Path("/proc/version").read_text().lower()
-            if "microsoft" in version_info or "wsl" in version_info:
-                # WSL - use Windows PowerShell
-                # Security: sanitize and use single-quoted strings to prevent injection
-                safe_title = _sanitize_powershell(title)
-                safe_message = _sanitize_powershell(message)
-                ps_script = f'''
-                Add-Type -AssemblyName System.Windows.Forms
-                $balloon = New-Object System.Windows.Forms.NotifyIcon
-                $balloon.Icon = [System.Drawing.SystemIcons]::Information
-                $balloon.BalloonTipTitle = '{safe_title}'
-                $balloon.BalloonTipText = '{safe_message}'
-                $balloon.Visible = $true
-                $balloon.ShowBalloonTip(5000)
-                Start-Sleep -Milliseconds 5100
-                $balloon.Dispose()
-                '''
-                return ["powershell.exe", "-Command", ps_script]
-        except Exception:
-            pass
-
-        # Try Linux notifiers in order of preference
-        if shutil.which("notify-send"):
+        # Linux/BSD - use whichever notifier was resolved for this machine
+        notifier = resolve_linux_notifier()
+        if notifier == "wsl":
+            # WSL - use Windows PowerShell
+            # Security: sanitize and use single-quoted strings to prevent injection
+            safe_title = _sanitize_powershell(title)
+            safe_message = _sanitize_powershell(message)
+            ps_script = f'''
+            Add-Type -AssemblyName System.Windows.Forms
+            $balloon = New-Object System.Windows.Forms.NotifyIcon
+            $balloon.Icon = [System.Drawing.SystemIcons]::Information
+            $balloon.BalloonTipTitle = '{safe_title}'
+            $balloon.BalloonTipText = '{safe_message}'
+            $balloon.Visible = $true
+            $balloon.ShowBalloonTip(5000)
+            Start-Sleep -Milliseconds 5100
+            $balloon.Dispose()
+            '''
+            return ["powershell.exe", *POWERSHELL_FLAGS, "-Command", ps_script]
+        elif notifier == "notify-send":
             return ["notify-send", title, message]
-        elif shutil.which("zenity"):
+        elif notifier == "zenity":
             return ["zenity", "--notification", f"--text={title}: {message}"]
-        elif shutil.which("kdialog"):
+        elif notifier == "kdialog":
             return ["kdialog", "--passivepopup", message, "5", "--title", title]
 
         # No notifier found
@@ -99,7 +156,12 @@ def get_notifier_command(title: str, message: str) -> list[str] | None:
 
 
 def send_notification(title: str, message: str) -> bool:
-    """Send notification, return True if successful."""
+    """Send notification, return True if the notifier was launched.
+
+    The notifier is started in its own session and not waited for: the
+    WSL balloon alone sleeps for five seconds, and nothing in the hook
+    depends on its result.
+    """
     cmd = get_notifier_command(title, message)
 
     if cmd is None:
@@ -107,14 +169,17 @@ def send_notification(title: str, message: str) -> bool:
         return False
 
     try:
-        log_debug(f"Sending notification via: {cmd[0]}")
-        subprocess.run(cmd, capture_output=True, timeout=10)
+        log_debug(lambda: f"Sending notification via: {cmd[0]}")
+        subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
         return True
-    except subprocess.TimeoutExpired:
-        log_debug("Notification command timed out")
-        return False
     except Exception as e:
-        log_debug(f"Notification failed: {e}")
+        log_debug(lambda: f"Notification failed: {e}")
         return False
 
 
@@ -132,7 +197,7 @@ def main() -> None:
         return
 
     hook_event = data.get("hook_event_name", "")
-    log_debug(f"Notification hook triggered for event: {hook_event}")
+    log_debug(lambda: f"Notification hook triggered for event: {hook_event}")
 
     if hook_event == "Stop":
         send_notification("Claude Code", "Task completed")
@@ -141,7 +206,7 @@ def main() -> None:
         notification_type = data.get("notification_type", "attention needed")
         send_notification("Claude Code", f"Attention: {notification_type}")
     else:
-        log_debug(f"Unhandled event type: {hook_event}")
+        log_debug(lambda: f"Unhandled event type: {hook_event}")
 
     # Never block workflow
     output_empty()
@@ -7,7 +7,14 @@
 
 import os
 import sys
+
+# Outside an OpenKanban terminal this hook does nothing. It fires on most
+# events, so bail out before importing pathlib and hook_utils.
+if __name__ == "__main__" and not os.environ.get("OPENKANBAN_SESSION"):
+    sys.exit(0)
+
 from pathlib import Path
+from typing import NamedTuple
 
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -23,15 +30,50 @@ from hook_utils import (
 CACHE_DIR = Path.home() / ".cache" / "openkanban-status"
 
 
+class StatusRule(NamedTuple):
+    """Status for a named hook event.
+
+    The status applies only when required_key is present in the input and
+    forbidden_key is absent (None skips that check); otherwise the data
+    shape decides via determine_status().
+    """
+
+    status: str
+    required_key: str | None = None
+    forbidden_key: str | None = None
+
+    def matches(self, data: dict) -> bool:
+        """Check the required and forbidden keys against the hook input."""
+        return (self.required_key is None or self.required_key in data) and (
+            self.forbidden_key is None or self.forbidden_key not in data
+        )
+
+
+STATUS_BY_EVENT = {
+    "SessionStart": StatusRule("idle"),
+    "UserPromptSubmit": StatusRule("working", required_key="prompt"),
+    "PreToolUse": StatusRule("working", required_key="tool_name", forbidden_key="tool_result"),
+    "PermissionRequest": StatusRule("waiting"),
+    "Stop": StatusRule("idle", required_key="stopReason"),
+}
+
+
 def write_status(session: str, status: str) -> None:
-    """Write status to cache file for session. Silent on failure."""
+    """Write status to cache file for session. Silent on failure.
+
+    The cache directory almost always exists already, so it is only
+    created when the first write finds it missing.
+    """
     try:
         status_file = CACHE_DIR / f"{session}.status"
-        status_file.parent.mkdir(parents=True, exist_ok=True)
-        status_file.write_text(status)
-        log_debug(f"wrote status '{status}' to {status_file}")
+        try:
+            status_file.write_text(status)
+        except FileNotFoundError:
+            status_file.parent.mkdir(parents=True, exist_ok=True)
+            status_file.write_text(status)
+        log_debug(lambda: f"wrote status '{status}' to {status_file}")
     except Exception as e:
-        log_debug(f"failed to write status: {e}")
+        log_debug(lambda: f"failed to write status: {e}")
 
 
 def determine_status(data: dict) -> str | None:
@@ -77,26 +119,16 @@ def main() -> None:
     if not data:
         return output_empty()
 
-    log_debug(f"session={session}, data_keys={list(data.keys())}")
+    log_debug(lambda: f"session={session}, data_keys={list(data.keys())}")
 
     # Determine status from hook event type
     hook_event = get_nested(data, "hookEventName", default="")
 
-    if hook_event == "SessionStart":
-        write_status(session, "idle")
-    elif hook_event == "UserPromptSubmit" and "prompt" in data:
-        write_status(session, "working")
-    elif hook_event == "PreToolUse" and "tool_name" in data and "tool_result" not in data:
-        write_status(session, "working")
-    elif hook_event == "PermissionRequest":
-        write_status(session, "waiting")
-    elif hook_event == "Stop" and "stopReason" in data:
-        write_status(session, "idle")
-    else:
-        # Unknown hook type or missing required fields - check by data shape
-        status = determine_status(data)
-        if status:
-            write_status(session, status)
+    rule = STATUS_BY_EVENT.get(hook_event)
+    # Unknown hook type or missing required fields falls back to data shape
+    status = rule.status if rule and rule.matches(data) else determine_status(data)
+    if status:
+        write_status(session, status)
 
     return output_empty()
 
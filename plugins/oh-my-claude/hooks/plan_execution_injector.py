@@ -21,8 +21,9 @@ cross-session recovery if the user /clear or restarts before completion.
 from __future__ import annotations
 
 import json
+import os
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
@@ -74,14 +75,7 @@ parallel tasks that benefit from inter-agent discussion.
 """
 
 
-def build_execution_context() -> str:
-    """Build execution context, including Agent Teams guidance."""
-    sections = []
-    teams_active = is_teams_enabled()
-
-    if teams_active:
-        # Team-first: AGENT_TEAMS_SECTION is primary, no delegation table
-        sections.append("""[PLAN APPROVED - READY FOR EXECUTION]
+TEAMS_EXECUTION_PROTOCOL = """[PLAN APPROVED - READY FOR EXECUTION]
 
 Your plan has been approved. When you return to execute:
 
@@ -92,12 +86,9 @@ Your plan has been approved. When you return to execute:
 3. **Spawn teammates** - `Agent(subagent_type="general-purpose", team_name="...", name="role")` per role
 4. **Assign work** - `TaskUpdate(taskId, owner="role")` to assign tasks to teammates
 5. **Monitor + verify** - `TaskList()` to track progress, run validation after changes
-6. **Do NOT deviate** - The plan was researched and approved""")
+6. **Do NOT deviate** - The plan was researched and approved"""
 
-        sections.append(AGENT_TEAMS_SECTION)
-    else:
-        # Solo mode: delegation table with supplementary teams info
-        sections.append("""[PLAN APPROVED - READY FOR EXECUTION]
+SOLO_EXECUTION_PROTOCOL = """[PLAN APPROVED - READY FOR EXECUTION]
 
 Your plan has been approved. When you return to execute:
 
@@ -116,11 +107,9 @@ Your plan has been approved. When you return to execute:
 | Find files | Explore (built-in) | Locating code, definitions |
 | Read content | oh-my-claude:librarian | Summarizing files >500 lines |
 | Implement | general-purpose (built-in) | Writing actual code changes |
-| Validate | oh-my-claude:validator | Running tests, linters |""")
-
-        sections.append(AGENT_TEAMS_SECTION)
+| Validate | oh-my-claude:validator | Running tests, linters |"""
 
-    sections.append("""## PLAN COMPLIANCE
+PLAN_COMPLIANCE_SECTION = """## PLAN COMPLIANCE
 
 | Allowed | NOT Allowed |
 |---------|-------------|
@@ -132,9 +121,30 @@ Your plan has been approved. When you return to execute:
 
 Plan state saved to `.claude/plans/.active-plan.json`.
 If you `/clear` or start a new session, check this file for active plan context.
-Draft interview notes in `.claude/plans/drafts/` have been cleaned up.""")
+Draft interview notes in `.claude/plans/drafts/` have been cleaned up."""
+
+# Both variants are fixed text, so assemble them once rather than per call
+TEAMS_EXECUTION_CONTEXT = f"{TEAMS_EXECUTION_PROTOCOL}\n{AGENT_TEAMS_SECTION}\n{PLAN_COMPLIANCE_SECTION}"
+SOLO_EXECUTION_CONTEXT = f"{SOLO_EXECUTION_PROTOCOL}\n{AGENT_TEAMS_SECTION}\n{PLAN_COMPLIANCE_SECTION}"
+
 
-    return "\n".join(sections)
+def build_execution_context() -> str:
+    """Build execution context, including Agent Teams guidance.
+
+    Teams mode leads with the team workflow; solo mode leads with the
+    delegation table. Both include the Agent Teams section.
+    """
+    return TEAMS_EXECUTION_CONTEXT if is_teams_enabled() else SOLO_EXECUTION_CONTEXT
+
+
+# Fixed .active-plan.json layout (same as json.dumps(..., indent=2)); the
+# timestamp needs no escaping, the session id goes through json.dumps
+PLAN_STATE_TEMPLATE = """{
+  "status": "executing",
+  "approved_at": "%s",
+  "session_id": %s
+}
+"""
 
 
 def track_plan_state(data: dict, cwd: str) -> None:
@@ -144,15 +154,16 @@ def track_plan_state(data: dict, cwd: str) -> None:
         plans_dir.mkdir(parents=True, exist_ok=True)
 
         state_file = plans_dir / ".active-plan.json"
-        state = {
-            "status": "executing",
-            "approved_at": datetime.now(timezone.utc).isoformat(),
-            "session_id": data.get("session_id", "unknown"),
-        }
-        state_file.write_text(json.dumps(state, indent=2) + "\n")
-        log_debug(f"Wrote plan state to {state_file}")
+        state_file.write_text(
+            PLAN_STATE_TEMPLATE
+            % (
+                time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime()),
+                json.dumps(data.get("session_id", "unknown")),
+            )
+        )
+        log_debug(lambda: f"Wrote plan state to {state_file}")
     except Exception as e:
-        log_debug(f"Failed to write plan state: {e}")
+        log_debug(lambda: f"Failed to write plan state: {e}")
 
 
 def cleanup_drafts(cwd: str) -> None:
@@ -160,15 +171,23 @@ def cleanup_drafts(cwd: str) -> None:
     try:
         drafts_dir = Path(cwd) / ".claude" / "plans" / "drafts"
         if drafts_dir.is_dir():
-            for draft in drafts_dir.glob("*.md"):
-                draft.unlink()
-                log_debug(f"Cleaned up draft: {draft}")
-            # Remove drafts dir if empty
-            if not any(drafts_dir.iterdir()):
+            # One scandir pass both removes drafts and learns whether
+            # anything else is left, so the directory is read only once
+            empty = True
+            with os.scandir(drafts_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md") and entry.is_file():
+                        os.unlink(entry.path)
+                        log_debug(lambda path=entry.path: f"Cleaned up draft: {path}")
+                    else:
+                        empty = False
+            if empty:
                 drafts_dir.rmdir()
                 log_debug("Removed empty drafts directory")
+            else:
+                log_debug("Drafts directory still has other files, keeping it")
     except Exception as e:
-        log_debug(f"Draft cleanup failed: {e}")
+        log_debug(lambda: f"Draft cleanup failed: {e}")
 
 
 @hook_main("ExitPlanMode")
@@ -26,6 +26,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 import json
 
 from hook_utils import (
+    COMPACT_SEPARATORS,
     get_nested,
     hook_main,
     log_debug,
@@ -35,38 +36,41 @@ from hook_utils import (
 )
 
 
+def spawn_git(args: list[str], cwd: str | None) -> subprocess.Popen:
+    """Start a git command without waiting for it."""
+    return subprocess.Popen(
+        ["git", *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        cwd=cwd,
+    )
+
+
 def get_git_state(cwd: str | None = None) -> dict:
-    """Get current git branch and uncommitted changes status."""
+    """Get current git branch and uncommitted changes status.
+
+    The three git queries are independent, so they run concurrently and
+    the hook waits roughly as long as the slowest one.
+    """
+    procs: list[subprocess.Popen] = []
     try:
-        # Get current branch
-        branch_result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-            timeout=5
-        )
-        branch = branch_result.stdout.strip() if branch_result.returncode == 0 else "unknown"
+        for args in (
+            ["rev-parse", "--abbrev-ref", "HEAD"],  # current branch
+            ["status", "--porcelain"],  # uncommitted changes
+            ["diff", "--cached", "--name-only"],  # staged files
+        ):
+            procs.append(spawn_git(args, cwd))
+        branch_proc, status_proc, staged_proc = procs
 
-        # Check for uncommitted changes
-        status_result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-            timeout=5
-        )
-        has_changes = bool(status_result.stdout.strip()) if status_result.returncode == 0 else False
+        branch_out, _ = branch_proc.communicate(timeout=5)
+        branch = branch_out.strip() if branch_proc.returncode == 0 else "unknown"
 
-        # Get staged files
-        staged_result = subprocess.run(
-            ["git", "diff", "--cached", "--name-only"],
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-            timeout=5
-        )
-        staged_files = staged_result.stdout.strip().split("\n") if staged_result.stdout.strip() else []
+        status_out, _ = status_proc.communicate(timeout=5)
+        has_changes = bool(status_out.strip()) if status_proc.returncode == 0 else False
+
+        staged_out, _ = staged_proc.communicate(timeout=5)
+        staged_files = staged_out.strip().split("\n") if staged_out.strip() else []
 
         return {
             "branch": branch,
@@ -74,12 +78,17 @@ def get_git_state(cwd: str | None = None) -> dict:
             "staged_files": staged_files[:10]
         }
     except Exception as e:
-        log_debug(f"get_git_state failed: {e}")
+        log_debug(lambda: f"get_git_state failed: {e}")
         return {
             "branch": "unknown",
             "uncommitted_changes": False,
             "staged_files": []
         }
+    finally:
+        for proc in procs:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
 
 
 def get_recent_files(cwd: str | None = None, limit: int = 10) -> list[str]:
@@ -97,7 +106,7 @@ def get_recent_files(cwd: str | None = None, limit: int = 10) -> list[str]:
             return files[:limit]
         return []
     except Exception as e:
-        log_debug(f"get_recent_files failed: {e}")
+        log_debug(lambda: f"get_recent_files failed: {e}")
         return []
 
 
@@ -289,7 +298,7 @@ def output_system_message(message: str) -> None:
     UserPromptSubmit, and PostToolUse).
     """
     response = {"systemMessage": message}
-    print(json.dumps(response))
+    print(json.dumps(response, separators=COMPACT_SEPARATORS))
 
 
 @hook_main("PreCompact")
@@ -316,7 +325,7 @@ def main() -> None:
     timestamp = datetime.now(timezone.utc).isoformat()
 
     context = format_context(mode, git_state, recent_files, todos, timestamp, patterns)
-    log_debug(f"preserving context: mode={mode}, branch={git_state.get('branch')}, patterns={len(patterns.get('problems', []))}p/{len(patterns.get('solutions', []))}s/{len(patterns.get('decisions', []))}d")
+    log_debug(lambda: f"preserving context: mode={mode}, branch={git_state.get('branch')}, patterns={len(patterns.get('problems', []))}p/{len(patterns.get('solutions', []))}s/{len(patterns.get('decisions', []))}d")
     output_system_message(context)
 
 
@@ -0,0 +1,46 @@
+#!/bin/sh
+# run_hook.sh - Launch a stdlib-only hook on a cached Python interpreter.
+#
+# `uv run --script` re-resolves the PEP 723 environment on every hook event,
+# which costs far more than the hook itself. Hooks with no third-party
+# dependencies don't need that: resolve a Python 3.11+ interpreter once,
+# cache its path, and exec it directly on every later event.
+#
+# The interpreter runs with -S: stdlib-only hooks never need site-packages,
+# and skipping site.py (.pth processing, sitecustomize) trims every start.
+#
+# Usage: run_hook.sh <hook_script.py>
+
+CACHE_FILE="${XDG_CACHE_HOME:-$HOME/.cache}/oh-my-claude/python"
+
+PYTHON=""
+if [ -r "$CACHE_FILE" ]; then
+    read -r PYTHON < "$CACHE_FILE"
+fi
+
+if [ -z "$PYTHON" ] || [ ! -x "$PYTHON" ]; then
+    PYTHON=""
+    if command -v uv > /dev/null 2>&1; then
+        # Not --system: uv-managed interpreters count too, otherwise users
+        # with only those would never get a cache. --no-project keeps a
+        # project .venv in the hook's cwd from being picked up.
+        PYTHON=$(uv python find --no-project '>=3.11' 2> /dev/null)
+        if [ -z "$PYTHON" ]; then
+            # No interpreter installed yet - let uv provision one as before;
+            # the next event finds and caches the managed interpreter
+            exec uv run --script "$@"
+        fi
+    elif command -v python3 > /dev/null 2>&1 \
+        && python3 -c 'import sys; sys.exit(sys.version_info < (3, 11))'; then
+        PYTHON=$(command -v python3)
+    else
+        echo "[ERROR] run_hook.sh: no Python 3.11+ interpreter found (install uv)" >&2
+        exit 1
+    fi
+
+    mkdir -p "${CACHE_FILE%/*}" \
+        && printf '%s\n' "$PYTHON" > "$CACHE_FILE.$$" \
+        && mv -f "$CACHE_FILE.$$" "$CACHE_FILE"
+fi
+
+exec "$PYTHON" -S "$@"
@@ -205,9 +205,9 @@ def check_redirect_safety(subcmd: str) -> bool:
     for redirect_match in re.finditer(r'(>>?)\s*(\S+)', subcmd):
         target_path = redirect_match.group(2).strip("'\"")
         if not is_path_in_project(target_path):
-            log_debug(f"redirect target {target_path} is outside project - unsafe")
+            log_debug(lambda target=target_path: f"redirect target {target} is outside project - unsafe")
             return False
-        log_debug(f"redirect target {target_path} is within project - safe")
+        log_debug(lambda target=target_path: f"redirect target {target} is within project - safe")
 
     return True  # All redirects safe (or no redirects)
 
@@ -231,8 +231,8 @@ def is_plugin_internal_script(command: str) -> bool:
         True if command references a script within CLAUDE_PLUGIN_ROOT.
     """
     plugin_root = os.environ.get("CLAUDE_PLUGIN_ROOT", "")
-    log_debug(f"CLAUDE_PLUGIN_ROOT='{plugin_root}'")
-    log_debug(f"command='{command[:200]}'")
+    log_debug(lambda: f"CLAUDE_PLUGIN_ROOT='{plugin_root}'")
+    log_debug(lambda: f"command='{command[:200]}'")
 
     if not plugin_root:
         log_debug("CLAUDE_PLUGIN_ROOT not set, cannot verify plugin script")
@@ -265,10 +265,10 @@ def is_plugin_internal_script(command: str) -> bool:
             resolved = os.path.realpath(script_path)
             plugin_resolved = os.path.realpath(plugin_root)
             if resolved.startswith(plugin_resolved + os.sep) or resolved == plugin_resolved:
-                log_debug(f"command script resolves under plugin root: {resolved}")
+                log_debug(lambda: f"command script resolves under plugin root: {resolved}")
                 return True
         except (OSError, ValueError) as e:
-            log_debug(f"path resolution error for plugin check: {e}")
+            log_debug(lambda: f"path resolution error for plugin check: {e}")
 
     log_debug("command does not reference a verified plugin script")
     return False
@@ -288,23 +288,23 @@ def is_path_in_project(path: str) -> bool:
         return False
 
     cwd = os.getcwd()
-    log_debug(f"cwd={cwd}, path={path}")
+    log_debug(lambda: f"cwd={cwd}, path={path}")
 
     # Security fix: resolve relative paths to absolute before checking.
     # A relative path like "../../etc/passwd" is not safe just because it's relative.
     if not os.path.isabs(path):
         path = os.path.join(cwd, path)
-        log_debug(f"resolved relative path to: {path}")
+        log_debug(lambda: f"resolved relative path to: {path}")
 
     # Resolve to absolute and check if within cwd
     try:
         resolved = os.path.realpath(path)
         cwd_resolved = os.path.realpath(cwd)
         is_within = resolved.startswith(cwd_resolved + os.sep) or resolved == cwd_resolved
-        log_debug(f"resolved={resolved}, is_within_cwd={is_within}")
+        log_debug(lambda: f"resolved={resolved}, is_within_cwd={is_within}")
         return is_within
     except (OSError, ValueError) as e:
-        log_debug(f"path resolution error: {e}")
+        log_debug(lambda: f"path resolution error: {e}")
         return False
 
 
@@ -375,7 +375,7 @@ def is_safe_read_tool(tool_name: str, tool_input: dict | str) -> tuple[bool, str
 
     # If no path specified, Glob/Grep default to cwd which is safe
     if not path and tool_name in ("Glob", "Grep"):
-        log_debug(f"{tool_name} with no path defaults to cwd - safe")
+        log_debug(lambda: f"{tool_name} with no path defaults to cwd - safe")
         return True, f"{tool_name}_project_dir"
 
     if is_path_in_project(path):
@@ -416,7 +416,7 @@ def is_safe_command(command: str) -> tuple[bool, str | None]:
     if not has_shell_operators(command):
         pattern = _match_safe_pattern(command)
         if pattern:
-            log_debug(f"command matched safe pattern: {pattern}")
+            log_debug(lambda: f"command matched safe pattern: {pattern}")
             return True, pattern
         return False, None
 
@@ -430,7 +430,7 @@ def is_safe_command(command: str) -> tuple[bool, str | None]:
     for subcmd in subcmds:
         # Verify redirect targets are within project
         if not check_redirect_safety(subcmd):
-            log_debug(f"sub-command has unsafe redirect: {subcmd}")
+            log_debug(lambda subcmd=subcmd: f"sub-command has unsafe redirect: {subcmd}")
             return False, None
 
         # Strip redirect for pattern matching
@@ -438,7 +438,7 @@ def is_safe_command(command: str) -> tuple[bool, str | None]:
 
         pattern = _match_safe_pattern(base_cmd)
         if not pattern:
-            log_debug(f"sub-command not in safe list: {base_cmd}")
+            log_debug(lambda cmd=base_cmd: f"sub-command not in safe list: {cmd}")
             return False, None
 
     log_debug("all sub-commands in compound command are safe")
@@ -476,19 +476,19 @@ def main() -> None:
 
     # Handle Read/Glob/Grep tools - auto-approve within project directory
     if tool_name in ("Read", "Glob", "Grep"):
-        log_debug(f"checking {tool_name} tool for project path")
+        log_debug(lambda: f"checking {tool_name} tool for project path")
         is_safe, reason = is_safe_read_tool(tool_name, tool_input)
         if is_safe:
-            log_debug(f"auto-approving {tool_name} (reason: {reason})")
+            log_debug(lambda: f"auto-approving {tool_name} (reason: {reason})")
             output_permission("allow", f"Auto-approved: {reason}")
         else:
-            log_debug(f"{tool_name} path outside project, deferring to user")
+            log_debug(lambda: f"{tool_name} path outside project, deferring to user")
             output_empty()
         return
 
     # Handle Bash tool
     if tool_name != "Bash":
-        log_debug(f"tool is {tool_name}, not handled - passing through")
+        log_debug(lambda: f"tool is {tool_name}, not handled - passing through")
         output_empty()
         return
 
@@ -504,19 +504,19 @@ def main() -> None:
         output_empty()
         return
 
-    log_debug(f"checking command: {command[:100]}...")
+    log_debug(lambda: f"checking command: {command[:100]}...")
 
     # Check catastrophic patterns — deny if not already approved via settings.json
     for pattern_name, pattern_regex, reason in CATASTROPHIC_PATTERNS:
         if pattern_regex.search(command):
-            log_debug(f"catastrophic command detected: {reason}")
+            log_debug(lambda reason=reason: f"catastrophic command detected: {reason}")
             output_permission("deny", f"Blocked: {reason}")
             return
 
     # Check if command is safe
     is_safe, pattern = is_safe_command(command)
     if is_safe:
-        log_debug(f"auto-approving safe command (pattern: {pattern})")
+        log_debug(lambda: f"auto-approving safe command (pattern: {pattern})")
         output_permission("allow", f"Auto-approved: {pattern}")
     else:
         log_debug("command not in safe list, deferring to user")
@@ -31,21 +31,28 @@ from hook_utils import (
     read_stdin_safe,
 )
 
+# Fixed response envelope; only the reason string needs JSON escaping
+DENY_TEMPLATE = '{"decision":"block","reason":%s}'
+
+
 def output_deny(reason: str) -> None:
-    """Output denial response for PreToolUse hook."""
-    response = {"decision": "block", "reason": reason}
-    print(json.dumps(response))
+    """Output denial response for PreToolUse hook.
+
+    The payload is ASCII (json.dumps escapes the reason), so it is written
+    to the binary buffer directly rather than through print().
+    """
+    sys.stdout.buffer.write((DENY_TEMPLATE % json.dumps(reason) + "\n").encode())
     sys.exit(0)
 
 
 # Source file extensions that should have tests
-SOURCE_EXTENSIONS = {
+SOURCE_EXTENSIONS = frozenset({
     ".ts", ".tsx", ".js", ".jsx",  # TypeScript/JavaScript
     ".py",                          # Python
     ".go",                          # Go
     ".rs",                          # Rust
     ".java",                        # Java
-}
+})
 
 # Patterns that indicate a file is already a test
 TEST_PATTERNS = [
@@ -79,20 +86,29 @@ def get_tdd_mode() -> str:
     """Get TDD mode from environment variable."""
     mode = os.environ.get("OMC_TDD_MODE", "off").lower()
     if mode not in ("off", "guided", "enforced"):
-        log_debug(f"Invalid OMC_TDD_MODE '{mode}', defaulting to 'off'")
+        log_debug(lambda: f"Invalid OMC_TDD_MODE '{mode}', defaulting to 'off'")
         return "off"
     return mode
 
 
+def file_suffix(path: str) -> str:
+    """Return the final suffix of path's filename, like Path(path).suffix.
+
+    String partitioning avoids building a Path object on every PreToolUse.
+    """
+    name = path.rpartition("/")[2]
+    i = name.rfind(".")
+    return name[i:] if 0 < i < len(name) - 1 else ""
+
+
 def is_source_file(path: str) -> bool:
     """Check if file is a source file that should have tests."""
-    ext = Path(path).suffix.lower()
-    return ext in SOURCE_EXTENSIONS
+    return file_suffix(path).lower() in SOURCE_EXTENSIONS
 
 
 def is_test_file(path: str) -> bool:
     """Check if file is already a test file."""
-    filename = Path(path).name
+    filename = path.rpartition("/")[2]
     for pattern in TEST_PATTERNS:
         if re.search(pattern, filename):
             return True
@@ -187,20 +203,20 @@ def main() -> None:
     if not file_path:
         return output_empty()
 
-    log_debug(f"Checking TDD for: {file_path}")
+    log_debug(lambda: f"Checking TDD for: {file_path}")
 
     # Check if it's a source file
     if not is_source_file(file_path):
-        log_debug(f"Not a source file: {file_path}")
+        log_debug(lambda: f"Not a source file: {file_path}")
         return output_empty()
 
     # Check exclusions
     if is_test_file(file_path):
-        log_debug(f"Is a test file: {file_path}")
+        log_debug(lambda: f"Is a test file: {file_path}")
         return output_empty()
 
     if is_excluded(file_path):
-        log_debug(f"Excluded path: {file_path}")
+        log_debug(lambda: f"Excluded path: {file_path}")
         return output_empty()
 
     # Look for test file
@@ -208,11 +224,11 @@ def main() -> None:
     test_file = find_test_file(file_path, cwd)
 
     if test_file:
-        log_debug(f"Test found: {test_file}")
+        log_debug(lambda: f"Test found: {test_file}")
         return output_empty()
 
     # No test found
-    log_debug(f"No test found for: {file_path}")
+    log_debug(lambda: f"No test found for: {file_path}")
 
     if mode == "enforced":
         output_deny(
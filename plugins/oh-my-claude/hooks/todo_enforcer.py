@@ -65,7 +65,7 @@ def analyze_transcript(transcript: list[dict[str, Any]], max_entries: int = 1000
 
     for i, entry in enumerate(transcript):
         if i >= max_entries:
-            log_debug(f"transcript truncated at {max_entries} entries")
+            log_debug(lambda: f"transcript truncated at {max_entries} entries")
             break
 
         entry_type = entry.get("type", "")
@@ -892,7 +892,7 @@ def main() -> None:
     cwd = data.get("cwd", ".")
     permission_mode = data.get("permission_mode", "")
 
-    log_debug(f"prompt starts with: {repr(prompt[:100])}")
+    log_debug(lambda: f"prompt starts with: {repr(prompt[:100])}")
 
     # ==========================================================================
     # PLAN EXECUTION - Check prompt content (handles Accept and clear)
@@ -919,7 +919,7 @@ def main() -> None:
     try:
         validation = detect_validation(cwd)
     except Exception as e:
-        log_debug(f"detect_validation failed: {e}")
+        log_debug(lambda: f"detect_validation failed: {e}")
         validation = "Run appropriate linters and tests for this project type."
 
     # ==========================================================================
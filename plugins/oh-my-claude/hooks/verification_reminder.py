@@ -56,7 +56,7 @@ def main() -> None:
 
     tool_name = get_nested(data, "tool_name", default="")
 
-    log_debug(f"tool_name={tool_name}")
+    log_debug(lambda: f"tool_name={tool_name}")
 
     if tool_name in {"Agent", "Task"}:
         log_debug("Agent completed, injecting verification reminder")
@@ -32,6 +32,12 @@ def get_context(output: dict) -> str:
     return output.get("hookSpecificOutput", {}).get("additionalContext", "")
 
 
+@pytest.fixture(autouse=True)
+def isolated_markers(tmp_path, monkeypatch):
+    """Keep per-session dedup markers out of the real temp dir."""
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+
+
 class TestGrepTriggersReminder:
     """Tests for Grep tool triggering agent usage reminder."""
 
@@ -130,7 +136,7 @@ class TestSessionTracking:
         """Different session IDs should be tracked independently."""
         output1 = run_hook({"tool_name": "Grep", "session_id": "session-a"})
         output2 = run_hook({"tool_name": "Grep", "session_id": "session-b"})
-        # Each subprocess is isolated, so both should get reminder
+        # Dedup is per session, so both should get reminder
         assert "Agent Usage Reminder" in get_context(output1)
         assert "Agent Usage Reminder" in get_context(output2)
 
@@ -158,6 +164,41 @@ class TestSessionTracking:
         context = get_context(output)
         assert "Agent Usage Reminder" in context
 
+    def test_reminds_once_per_session(self):
+        """Second search in the same session should not repeat the reminder."""
+        first = run_hook({"tool_name": "Grep", "session_id": "repeat-session"})
+        second = run_hook({"tool_name": "Glob", "session_id": "repeat-session"})
+        assert "Agent Usage Reminder" in get_context(first)
+        assert second == {}
+
+    def test_no_reminder_after_agent_used(self):
+        """Sessions that already delegated to an agent are not reminded."""
+        run_hook({"tool_name": "Agent", "session_id": "delegating-session"})
+        output = run_hook({"tool_name": "Grep", "session_id": "delegating-session"})
+        assert output == {}
+
+    def test_empty_session_id_not_deduped(self):
+        """Without a session_id every search gets the reminder."""
+        run_hook({"tool_name": "Grep", "session_id": ""})
+        output = run_hook({"tool_name": "Grep", "session_id": ""})
+        assert "Agent Usage Reminder" in get_context(output)
+
+    def test_stale_session_markers_swept(self, tmp_path):
+        """Claiming a new marker removes week-old markers of finished sessions."""
+        import os
+        import time
+
+        stale = [tmp_path / "omc_reminded_old", tmp_path / "omc_agent_used_old"]
+        unrelated = tmp_path / "other_file"
+        old = time.time() - 8 * 24 * 60 * 60
+        for path in (*stale, unrelated):
+            path.touch()
+            os.utime(path, (old, old))
+        run_hook({"tool_name": "Grep", "session_id": "fresh-session"})
+        assert not any(path.exists() for path in stale)
+        assert unrelated.exists()
+        assert (tmp_path / "omc_reminded_fresh-session").exists()
+
 
 class TestOtherToolsNoReminder:
     """Tests for other tools not triggering reminder."""
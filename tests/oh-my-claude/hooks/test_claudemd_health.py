@@ -6,16 +6,19 @@ import json
 import subprocess
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from claudemd_health import (
     MAX_INSTRUCTIONS_HEALTHY,
     MAX_LINES_HEALTHY,
+    MAX_LINES_TO_ANALYZE,
     analyze_claudemd,
     count_instructions,
     detect_nested_opportunities,
     find_hardcoded_paths,
+    truncate_lines,
 )
 
 HOOK_PATH = Path(__file__).parent.parent.parent.parent / "plugins/oh-my-claude/hooks/claudemd_health.py"
@@ -99,6 +102,16 @@ class TestCountInstructions:
         content = "Use, when possible, the standard library"
         assert count_instructions(content) == 1
 
+    def test_verb_prefix_of_longer_word_not_counted(self):
+        """Words that merely start with a verb should not be counted."""
+        content = "Users may configure this\nDocumentation lives here\nSettings"
+        assert count_instructions(content) == 0
+
+    def test_crlf_line_endings(self):
+        """CRLF line endings should be handled like LF."""
+        content = "- First\r\nAlways test\r\nplain text"
+        assert count_instructions(content) == 2
+
 
 # =============================================================================
 # Unit Tests: find_hardcoded_paths
@@ -186,6 +199,30 @@ class TestDetectNestedOpportunities:
         suggestions = detect_nested_opportunities(tmp_path, content)
         assert any("testing" in s.lower() for s in suggestions)
 
+    def test_counts_each_topic_independently(self, tmp_path):
+        """Interleaved topics should each reach the threshold on their own."""
+        content = "test api " * 5 + "component " * 4
+        suggestions = detect_nested_opportunities(tmp_path, content)
+        assert any("'testing'" in s for s in suggestions)
+        assert any("'api'" in s for s in suggestions)
+        assert not any("'components'" in s for s in suggestions)
+
+    def test_overlapping_topic_mentions_counted_for_each_topic(self, tmp_path):
+        """Text matching two topics at once counts toward both of them."""
+        content = "routest " * 5
+        suggestions = detect_nested_opportunities(tmp_path, content)
+        assert any("'testing'" in s for s in suggestions)
+        assert any("'api'" in s for s in suggestions)
+
+    def test_shared_claudemd_path_checked_once(self, tmp_path):
+        """tests/CLAUDE.md is stat'ed once for both directory and topic checks."""
+        (tmp_path / "tests").mkdir()
+        content = "test " * 10
+        with patch("claudemd_health.os.path.exists", return_value=False) as mock_exists:
+            suggestions = detect_nested_opportunities(tmp_path, content)
+        assert mock_exists.call_count == 1
+        assert any("'testing'" in s for s in suggestions)
+
     def test_caps_at_3_suggestions(self, tmp_path):
         """Should cap total suggestions at 3 (plus /init-deep reference)."""
         # Create many directories without CLAUDE.md
@@ -220,50 +257,57 @@ class TestDetectNestedOpportunities:
 class TestAnalyzeClaudemd:
     """Tests for analyze_claudemd function."""
 
-    def test_warns_large_file(self, tmp_path):
+    @staticmethod
+    def analyze(content: str) -> list[str]:
+        return analyze_claudemd(content, content.count("\n") + 1)
+
+    def test_warns_large_file(self):
         """Should warn when CLAUDE.md exceeds MAX_LINES_HEALTHY."""
-        claudemd = tmp_path / "CLAUDE.md"
         content = "\n".join(f"Line {i}" for i in range(MAX_LINES_HEALTHY + 10))
-        claudemd.write_text(content)
-        warnings = analyze_claudemd(claudemd)
+        warnings = self.analyze(content)
         assert any("large" in w.lower() for w in warnings)
 
-    def test_warns_high_instruction_density(self, tmp_path):
+    def test_warns_high_instruction_density(self):
         """Should warn when instruction count exceeds MAX_INSTRUCTIONS_HEALTHY."""
-        claudemd = tmp_path / "CLAUDE.md"
         # Generate many bullet points to exceed instruction threshold
         lines = [f"- Instruction number {i}" for i in range(MAX_INSTRUCTIONS_HEALTHY + 10)]
-        claudemd.write_text("\n".join(lines))
-        warnings = analyze_claudemd(claudemd)
+        warnings = self.analyze("\n".join(lines))
         assert any("instruction" in w.lower() for w in warnings)
 
-    def test_reports_hardcoded_paths(self, tmp_path):
+    def test_reports_hardcoded_paths(self):
         """Should report hardcoded file paths."""
-        claudemd = tmp_path / "CLAUDE.md"
-        claudemd.write_text("Important: src/utils/auth.ts handles authentication\n" * 5)
-        warnings = analyze_claudemd(claudemd)
+        warnings = self.analyze("Important: src/utils/auth.ts handles authentication\n" * 5)
         assert any("hardcoded" in w.lower() for w in warnings)
 
-    def test_empty_for_healthy_file(self, tmp_path):
+    def test_empty_for_healthy_file(self):
         """Should return empty list for a healthy CLAUDE.md."""
-        claudemd = tmp_path / "CLAUDE.md"
-        claudemd.write_text("# Project\n\nSimple instructions here.")
-        warnings = analyze_claudemd(claudemd)
+        warnings = self.analyze("# Project\n\nSimple instructions here.")
         assert warnings == []
 
-    def test_handles_unreadable_file(self, tmp_path):
-        """Should return empty list for unreadable file."""
-        claudemd = tmp_path / "CLAUDE.md"
-        # File does not exist
-        warnings = analyze_claudemd(claudemd)
-        assert warnings == []
+    def test_skips_instruction_scan_below_budget(self):
+        """Files with fewer lines than the budget can't exceed it."""
+        content = "\n".join(f"- Instruction {i}" for i in range(MAX_INSTRUCTIONS_HEALTHY))
+        with patch("claudemd_health.count_instructions") as mock_count:
+            self.analyze(content)
+        mock_count.assert_not_called()
+
+    def test_truncates_very_large_file(self):
+        """Should cap the analyzed line count at MAX_LINES_TO_ANALYZE."""
+        content = "\n".join(f"Line {i}" for i in range(MAX_LINES_TO_ANALYZE * 2))
+        warnings = self.analyze(content)
+        assert any(f"({MAX_LINES_TO_ANALYZE} lines)" in w for w in warnings)
 
-    def test_handles_binary_content(self, tmp_path):
-        """Should handle file with binary/undecodable content."""
-        claudemd = tmp_path / "CLAUDE.md"
-        claudemd.write_bytes(b"\x80\x81\x82" * 100)
-        warnings = analyze_claudemd(claudemd)
-        assert warnings == []  # Gracefully returns empty
+
+class TestTruncateLines:
+    """Tests for truncate_lines function."""
+
+    def test_short_content_unchanged(self):
+        """Content within the limit is returned as-is."""
+        assert truncate_lines("a\nb\nc", 5) == "a\nb\nc"
+
+    def test_truncates_to_max_lines(self):
+        """Content beyond the limit keeps only the first max_lines lines."""
+        assert truncate_lines("a\nb\nc\nd", 2) == "a\nb"
 
 
 # =============================================================================
@@ -293,6 +337,12 @@ class TestMainIntegration:
         context = get_context(output)
         assert "Health Check" in context
 
+    def test_skips_unreadable_claudemd(self, tmp_path):
+        """Should skip when CLAUDE.md has undecodable content."""
+        (tmp_path / "CLAUDE.md").write_bytes(b"\x80\x81\x82" * 100)
+        output = run_hook({"cwd": str(tmp_path)})
+        assert output == {}
+
     def test_empty_for_healthy_claudemd(self, tmp_path):
         """Should output nothing for a healthy CLAUDE.md."""
         claudemd = tmp_path / "CLAUDE.md"
@@ -161,6 +161,17 @@ class TestEdgeCases:
         context = get_context(output)
         assert "Context Protection ACTIVE" not in context
 
+    def test_non_ascii_emitted_as_utf8(self):
+        """Non-ASCII SOP text is written as UTF-8, not \\u escapes."""
+        result = subprocess.run(
+            [sys.executable, str(HOOK_PATH)],
+            input=b"{}",
+            capture_output=True,
+            env=_make_env(teams_enabled=True),
+        )
+        assert "—".encode() in result.stdout
+        assert b"\\u2014" not in result.stdout
+
 
 class TestTeamLeadBehavior:
     """Tests for dual-mode SOP: team lead vs solo session."""
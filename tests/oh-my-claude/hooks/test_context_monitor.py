@@ -7,7 +7,8 @@ These tests ensure the context monitoring hook correctly:
 4. Respects environment variable configuration
 """
 
-from pathlib import Path
+import os
+import time
 from unittest.mock import patch
 
 import pytest
@@ -22,7 +23,9 @@ from context_monitor import (
     get_warning_threshold,
     has_warned,
     mark_warned,
+    peek_native_percentage,
 )
+from hook_utils import MARKER_MAX_AGE_SECONDS
 
 
 class TestEstimateTokens:
@@ -38,9 +41,8 @@ class TestEstimateTokens:
 
     def test_single_short_entry(self):
         """Single entry with known length should estimate correctly."""
-        transcript = [{"content": "hello"}]
-        result = estimate_tokens(transcript)
-        assert result == len(str(transcript[0])) // 4
+        transcript = [{"content": "hello world!"}]
+        assert estimate_tokens(transcript) == 3  # 12 chars of content
 
     def test_multiple_entries_sum_correctly(self):
         """Multiple entries should have their characters summed."""
@@ -50,12 +52,17 @@ class TestEstimateTokens:
         assert estimate_tokens(transcript) == 75  # (100 + 200) // 4
 
     def test_handles_dict_entries(self):
-        """Dict entries should be stringified and counted."""
+        """Dict entries should count their leaf values, not their keys."""
         transcript = [{"role": "user", "content": "test message"}]
         result = estimate_tokens(transcript)
-        expected_chars = len(str(transcript[0]))
+        expected_chars = len("user") + len("test message")
         assert result == expected_chars // 4
 
+    def test_handles_nested_content_blocks(self):
+        """Nested lists/dicts (content blocks) should be walked."""
+        transcript = [{"content": [{"type": "text", "text": "x" * 96}]}]
+        assert estimate_tokens(transcript) == 25  # (96 + len("text")) // 4
+
     def test_handles_mixed_types(self):
         """Should handle mixed entry types in transcript."""
         transcript = [
@@ -64,7 +71,7 @@ class TestEstimateTokens:
             123,
             ["nested", "list"],
         ]
-        total_chars = sum(len(str(entry)) for entry in transcript)
+        total_chars = len("plain string") + len("assistant") + len("response") + 3 + 10
         assert estimate_tokens(transcript) == total_chars // 4
 
     def test_large_transcript_estimation(self):
@@ -72,13 +79,12 @@ class TestEstimateTokens:
         message = {"role": "user", "content": "x" * 150}
         transcript = [message] * 1000
         result = estimate_tokens(transcript)
-        assert result > 40000
+        assert result == 1000 * (len("user") + 150) // 4
 
     def test_empty_entries_contribute_minimally(self):
-        """Empty or minimal entries should contribute their str() representation."""
+        """Empty or minimal entries should contribute nothing."""
         transcript = [{}, "", {"content": ""}]
-        result = estimate_tokens(transcript)
-        assert result >= 0
+        assert estimate_tokens(transcript) == 0
 
 
 class TestThresholdDefaults:
@@ -185,45 +191,88 @@ class TestSessionDeduplication:
     """Tests for filesystem-based session warning deduplication.
 
     Each hook invocation is a fresh Python process, so dedup uses
-    filesystem markers at /tmp/omc_context_{session_id}_{threshold}.
+    filesystem markers at $TMPDIR/omc_context_{session_id}_{threshold}.
     """
 
     def test_no_marker_means_not_warned(self, tmp_path, monkeypatch):
         """Fresh session should not show as warned."""
-        monkeypatch.setattr("context_monitor._DEDUP_DIR", tmp_path)
+        monkeypatch.setattr("hook_utils.MARKER_DIR", str(tmp_path))
         assert not has_warned("session_123", "warning")
 
     def test_mark_creates_file(self, tmp_path, monkeypatch):
         """mark_warned should create a marker file."""
-        monkeypatch.setattr("context_monitor._DEDUP_DIR", tmp_path)
+        monkeypatch.setattr("hook_utils.MARKER_DIR", str(tmp_path))
         mark_warned("session_123", "warning")
         assert (tmp_path / "omc_context_session_123_warning").exists()
 
     def test_has_warned_after_mark(self, tmp_path, monkeypatch):
         """has_warned returns True after mark_warned."""
-        monkeypatch.setattr("context_monitor._DEDUP_DIR", tmp_path)
+        monkeypatch.setattr("hook_utils.MARKER_DIR", str(tmp_path))
         mark_warned("session_abc", "critical")
         assert has_warned("session_abc", "critical")
 
     def test_different_thresholds_tracked_separately(self, tmp_path, monkeypatch):
         """Warning and critical markers are independent per session."""
-        monkeypatch.setattr("context_monitor._DEDUP_DIR", tmp_path)
+        monkeypatch.setattr("hook_utils.MARKER_DIR", str(tmp_path))
         mark_warned("session_1", "warning")
         assert has_warned("session_1", "warning")
         assert not has_warned("session_1", "critical")
 
     def test_different_sessions_tracked_separately(self, tmp_path, monkeypatch):
         """Markers are independent across sessions."""
-        monkeypatch.setattr("context_monitor._DEDUP_DIR", tmp_path)
+        monkeypatch.setattr("hook_utils.MARKER_DIR", str(tmp_path))
         mark_warned("session_1", "warning")
         assert not has_warned("session_2", "warning")
 
     def test_mark_warned_handles_os_error(self, monkeypatch):
         """mark_warned should not raise on OSError."""
-        monkeypatch.setattr("context_monitor._DEDUP_DIR", Path("/nonexistent/path"))
+        monkeypatch.setattr("hook_utils.MARKER_DIR", "/nonexistent/path")
         # Should not raise
         mark_warned("session_err", "warning")
 
+    def test_mark_warned_sweeps_stale_markers(self, tmp_path, monkeypatch):
+        """Old markers are deleted when a new one is written; others stay."""
+        monkeypatch.setattr("hook_utils.MARKER_DIR", str(tmp_path))
+        stale = tmp_path / "omc_context_old_warning"
+        unrelated = tmp_path / "other_file"
+        stale.touch()
+        unrelated.touch()
+        old = time.time() - MARKER_MAX_AGE_SECONDS - 60
+        os.utime(stale, (old, old))
+        os.utime(unrelated, (old, old))
+        mark_warned("session_new", "warning")
+        assert not stale.exists()
+        assert unrelated.exists()
+        assert has_warned("session_new", "warning")
+
+    def test_both_markers_skip_usage_calculation(self, tmp_path, monkeypatch):
+        """After both warnings, main exits before estimating usage."""
+        from context_monitor import main
+
+        monkeypatch.setattr("hook_utils.MARKER_DIR", str(tmp_path))
+        mark_warned("session_done", "critical")
+        mark_warned("session_done", "warning")
+        raw = '{"session_id": "session_done", "transcript": ["x"]}'
+        with patch("context_monitor.read_stdin_safe", return_value=raw), \
+                patch("context_monitor.get_usage_percentage") as mock_usage:
+            with pytest.raises(SystemExit):
+                main()
+        mock_usage.assert_not_called()
+
+
+    def test_warning_still_sent_after_critical_only(self, tmp_path, monkeypatch, capsys):
+        """A session that skipped past warning into critical still gets the
+        one-time warning once usage drops back between the thresholds."""
+        from context_monitor import main
+
+        monkeypatch.setattr("hook_utils.MARKER_DIR", str(tmp_path))
+        mark_warned("session_compacted", "critical")
+        raw = '{"session_id": "session_compacted", "context_window": {"used_percentage": 75}}'
+        with patch("context_monitor.read_stdin_safe", return_value=raw):
+            main()
+        assert "75% used" in capsys.readouterr().out
+        assert has_warned("session_compacted", "warning")
+
 
 class TestGetUsagePercentage:
     """Tests for get_usage_percentage: native vs fallback."""
@@ -256,6 +305,40 @@ class TestGetUsagePercentage:
         result = get_usage_percentage(data)
         assert abs(result - 0.80) < 0.01
 
+    def test_fallback_ignores_non_transcript_fields(self):
+        """Only the transcript is estimated, not tool payloads beside it."""
+        data = {
+            "transcript": [{"role": "user", "content": "hi"}],
+            "tool_response": {"content": "x" * (CONTEXT_LIMIT * 4)},
+        }
+        assert get_usage_percentage(data) < 0.01
+
+    def test_fallback_counts_transcript_leaf_text(self):
+        """The hook's fallback measures message text inside content blocks."""
+        chars = CONTEXT_LIMIT * 4 * 75 // 100
+        data = {
+            "transcript": [
+                {"role": "assistant", "content": [{"type": "text", "text": "x" * chars}]},
+            ]
+        }
+        assert abs(get_usage_percentage(data) - 0.75) < 0.01
+
+    def test_main_warns_from_transcript_estimate(self, tmp_path, monkeypatch, capsys):
+        """Without native usage, main warns based on the transcript estimate."""
+        import json
+
+        from context_monitor import main
+
+        monkeypatch.setattr("hook_utils.MARKER_DIR", str(tmp_path))
+        chars = CONTEXT_LIMIT * 4 * 75 // 100
+        raw = json.dumps({
+            "session_id": "s",
+            "transcript": [{"role": "user", "content": [{"type": "text", "text": "x" * chars}]}],
+        })
+        with patch("context_monitor.read_stdin_safe", return_value=raw):
+            main()
+        assert "75% used" in capsys.readouterr().out
+
     def test_fallback_when_used_percentage_missing(self):
         """Falls back when context_window exists but used_percentage is absent."""
         data = {"context_window": {}, "transcript": []}
@@ -300,6 +383,61 @@ class TestGetUsagePercentage:
             mock_debug.assert_called()
 
 
+class TestPeekNativePercentage:
+    """Tests for reading the native percentage from raw JSON."""
+
+    def test_reads_value(self):
+        raw = '{"context_window": {"used_percentage": 42.5}, "tool_name": "Read"}'
+        assert peek_native_percentage(raw) == 0.425
+
+    def test_missing_returns_none(self):
+        assert peek_native_percentage('{"tool_name": "Read"}') is None
+
+    def test_non_numeric_returns_none(self):
+        raw = '{"context_window": {"used_percentage": "high"}}'
+        assert peek_native_percentage(raw) is None
+
+    def test_value_outside_context_window_ignored(self):
+        """used_percentage elsewhere in the payload is not trusted."""
+        raw = '{"tool_name": "Read", "tool_response": {"used_percentage": 10}}'
+        assert peek_native_percentage(raw) is None
+
+    def test_context_window_without_value_ignored(self):
+        """A later used_percentage doesn't count for an empty context_window."""
+        raw = (
+            '{"context_window": {"total_input_tokens": 1000},'
+            ' "tool_response": {"used_percentage": 10}}'
+        )
+        assert peek_native_percentage(raw) is None
+
+    def test_reads_value_despite_tool_output_key(self):
+        """The value is taken from context_window, not from tool output."""
+        raw = (
+            '{"tool_response": {"used_percentage": 99},'
+            ' "context_window": {"total_input_tokens": 1000, "used_percentage": 10}}'
+        )
+        assert peek_native_percentage(raw) == 0.10
+
+    def test_ambiguous_returns_none(self):
+        """A second context_window (e.g. in tool output) disables the fast path."""
+        raw = (
+            '{"context_window": {"used_percentage": 10},'
+            ' "tool_response": {"context_window": {"used_percentage": 99}}}'
+        )
+        assert peek_native_percentage(raw) is None
+
+    def test_low_usage_skips_json_parse(self):
+        """Below the warning threshold main exits without decoding input."""
+        from context_monitor import main
+
+        raw = '{"session_id": "s", "context_window": {"used_percentage": 5}}'
+        with patch("context_monitor.read_stdin_safe", return_value=raw), \
+                patch("context_monitor.parse_hook_input") as mock_parse:
+            with pytest.raises(SystemExit):
+                main()
+        mock_parse.assert_not_called()
+
+
 class TestTokenToCharacterMapping:
     """Tests verifying the ~4 chars per token heuristic."""
 
@@ -15,9 +15,8 @@ from delegation_enforcer import (
     EXECUTION_MARKERS,
     SHORT_CHANGE_THRESHOLD,
     TEAM_LEAD_REMINDER,
-    has_direct_marker,
     is_execution_mode,
-    is_short_change,
+    scan_tool_input,
 )
 
 HOOK_PATH = Path(__file__).parent.parent.parent.parent / "plugins/oh-my-claude/hooks/delegation_enforcer.py"
@@ -46,101 +45,121 @@ def get_context(output: dict) -> str:
 
 
 # =============================================================================
-# Unit Tests: has_direct_marker
+# Unit Tests: scan_tool_input ([DIRECT] marker)
 # =============================================================================
 
 
-class TestHasDirectMarker:
-    """Tests for has_direct_marker function."""
+class TestScanDirectMarker:
+    """Tests for the has_direct half of scan_tool_input."""
 
     def test_finds_marker_in_old_string(self):
         """Should find [direct] in old_string field."""
-        assert has_direct_marker({"old_string": "some code [direct]"}) is True
+        assert scan_tool_input({"old_string": "some code [direct]"})[0] is True
 
     def test_finds_marker_in_new_string(self):
         """Should find [direct] in new_string field."""
-        assert has_direct_marker({"new_string": "[direct] new code"}) is True
+        assert scan_tool_input({"new_string": "[direct] new code"})[0] is True
 
     def test_finds_marker_in_content(self):
         """Should find [direct] in content field."""
-        assert has_direct_marker({"content": "writing [direct] content"}) is True
+        assert scan_tool_input({"content": "writing [direct] content"})[0] is True
 
     def test_finds_marker_in_file_path(self):
         """Should find [direct] in file_path field."""
-        assert has_direct_marker({"file_path": "/path/[direct]/file.py"}) is True
+        assert scan_tool_input({"file_path": "/path/[direct]/file.py"})[0] is True
 
     def test_case_insensitive(self):
         """Should match [DIRECT] case-insensitively."""
-        assert has_direct_marker({"new_string": "[DIRECT] code"}) is True
-        assert has_direct_marker({"new_string": "[Direct] code"}) is True
-        assert has_direct_marker({"new_string": "[dIrEcT] code"}) is True
+        assert scan_tool_input({"new_string": "[DIRECT] code"})[0] is True
+        assert scan_tool_input({"new_string": "[Direct] code"})[0] is True
+        assert scan_tool_input({"new_string": "[dIrEcT] code"})[0] is True
 
     def test_returns_false_when_absent(self):
         """Should return False when no marker is present."""
-        assert has_direct_marker({"new_string": "normal code change"}) is False
+        assert scan_tool_input({"new_string": "normal code change"})[0] is False
 
     def test_returns_false_for_empty_dict(self):
         """Should return False for empty tool input."""
-        assert has_direct_marker({}) is False
+        assert scan_tool_input({})[0] is False
 
     def test_returns_false_for_non_string_values(self):
         """Should handle non-string values gracefully."""
-        assert has_direct_marker({"new_string": 42}) is False
-        assert has_direct_marker({"content": None}) is False
-        assert has_direct_marker({"old_string": ["list"]}) is False
+        assert scan_tool_input({"new_string": 42})[0] is False
+        assert scan_tool_input({"content": None})[0] is False
+        assert scan_tool_input({"old_string": ["list"]})[0] is False
 
 
 # =============================================================================
-# Unit Tests: is_short_change
+# Unit Tests: scan_tool_input (short changes)
 # =============================================================================
 
 
-class TestIsShortChange:
-    """Tests for is_short_change function."""
+class TestScanShortChange:
+    """Tests for the is_short half of scan_tool_input."""
 
     def test_short_new_string(self):
         """Should return True for new_string under threshold."""
         lines = "\n".join(f"line {i}" for i in range(5))
-        assert is_short_change({"new_string": lines}) is True
+        assert scan_tool_input({"new_string": lines})[1] is True
 
     def test_long_new_string(self):
         """Should return False for new_string at or over threshold."""
         lines = "\n".join(f"line {i}" for i in range(SHORT_CHANGE_THRESHOLD))
-        assert is_short_change({"new_string": lines}) is False
+        assert scan_tool_input({"new_string": lines})[1] is False
 
     def test_short_content_write_tool(self):
         """Should return True for short content (Write tool)."""
         content = "short file\nwith a few lines"
-        assert is_short_change({"content": content}) is True
+        assert scan_tool_input({"content": content})[1] is True
 
     def test_long_content_write_tool(self):
         """Should return False for long content (Write tool)."""
         content = "\n".join(f"line {i}" for i in range(SHORT_CHANGE_THRESHOLD))
-        assert is_short_change({"content": content}) is False
+        assert scan_tool_input({"content": content})[1] is False
 
     def test_returns_false_no_new_string_or_content(self):
         """Should return False when neither new_string nor content present."""
-        assert is_short_change({}) is False
-        assert is_short_change({"old_string": "something"}) is False
+        assert scan_tool_input({})[1] is False
+        assert scan_tool_input({"old_string": "something"})[1] is False
 
     def test_empty_new_string(self):
         """Empty new_string (falsy) should return False."""
-        assert is_short_change({"new_string": ""}) is False
+        assert scan_tool_input({"new_string": ""})[1] is False
 
     def test_single_line_is_short(self):
         """A single line should be short."""
-        assert is_short_change({"new_string": "one line"}) is True
+        assert scan_tool_input({"new_string": "one line"})[1] is True
 
     def test_exactly_threshold_minus_one(self):
         """Exactly threshold-1 lines should be short."""
         lines = "\n".join(f"line {i}" for i in range(SHORT_CHANGE_THRESHOLD - 1))
-        assert is_short_change({"new_string": lines}) is True
+        assert scan_tool_input({"new_string": lines})[1] is True
 
     def test_new_string_takes_precedence(self):
         """When new_string is present and short, content is not checked."""
         short_new = "short"
         long_content = "\n".join(f"line {i}" for i in range(50))
-        assert is_short_change({"new_string": short_new, "content": long_content}) is True
+        assert scan_tool_input({"new_string": short_new, "content": long_content})[1] is True
+
+
+# =============================================================================
+# Unit Tests: scan_tool_input
+# =============================================================================
+
+
+class TestScanToolInput:
+    """Tests for scan_tool_input function."""
+
+    def test_reports_both_signals(self):
+        """A short edit carrying [DIRECT] should report both signals."""
+        assert scan_tool_input({"new_string": "[Direct] fix"}) == (True, True)
+
+    def test_long_edit_without_marker(self):
+        long_string = "\n".join(f"line {i}" for i in range(50))
+        assert scan_tool_input({"new_string": long_string}) == (False, False)
+
+    def test_ignores_non_string_fields(self):
+        assert scan_tool_input({"content": ["[direct]"], "file_path": None}) == (False, False)
 
 
 # =============================================================================
@@ -182,7 +201,7 @@ class TestIsExecutionMode:
         assert is_execution_mode({}) is False
 
     def test_case_insensitive_detection(self):
-        """Markers should match case-insensitively (prompt is lowered)."""
+        """Markers should match case-insensitively."""
         data = {"prompt": "running ULTRAWORK mode now"}
         assert is_execution_mode(data) is True
 
@@ -196,6 +215,11 @@ class TestIsExecutionMode:
         data = {"transcript": "normal context", "prompt": "ulw fix bugs"}
         assert is_execution_mode(data) is True
 
+    def test_detects_marker_in_structured_transcript(self):
+        """List/dict transcripts should still be searched."""
+        data = {"transcript": [{"role": "user", "content": "start plan execution"}]}
+        assert is_execution_mode(data) is True
+
 
 # =============================================================================
 # Integration Tests: main function via subprocess
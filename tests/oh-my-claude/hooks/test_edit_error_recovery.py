@@ -234,19 +234,10 @@ class TestErrorPatterns:
         """Should have exactly three error patterns."""
         assert len(ERROR_PATTERNS) == 3
 
-    def test_all_patterns_are_compiled(self):
-        """All patterns should be compiled regex objects."""
-        import re
-
-        for pattern in ERROR_PATTERNS:
-            assert isinstance(pattern, re.Pattern)
-
-    def test_all_patterns_are_case_insensitive(self):
-        """All patterns should have IGNORECASE flag."""
-        import re
-
+    def test_patterns_are_lowercase_literals(self):
+        """Patterns are compared against lowered output, so must be lowercase."""
         for pattern in ERROR_PATTERNS:
-            assert pattern.flags & re.IGNORECASE
+            assert pattern == pattern.lower()
 
 
 class TestRealWorldScenarios:
@@ -1,7 +1,11 @@
 """Tests for hook_utils.py."""
 
+import gc
 import json
 import re
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -9,16 +13,41 @@ import pytest
 from hook_utils import (
     RegexCache,
     WhichCache,
+    claim_marker,
     get_nested,
     get_session_context,
+    has_marker,
+    hook_main,
     is_agent_session,
     is_teams_enabled,
+    log_debug,
     output_block,
     output_context,
     output_stop_block,
     parse_hook_input,
+    read_hook_input,
 )
 
+HOOKS_DIR = Path(__file__).parent.parent.parent.parent / "plugins/oh-my-claude/hooks"
+
+
+class TestLogDebug:
+    """Tests for log_debug function."""
+
+    def test_lazy_message_not_built_when_disabled(self, capsys):
+        """Callable messages are not evaluated when DEBUG is off."""
+        calls = []
+        with patch("hook_utils.DEBUG", False):
+            log_debug(lambda: calls.append(1) or "msg")
+        assert calls == []
+        assert capsys.readouterr().err == ""
+
+    def test_lazy_message_logged_when_enabled(self, capsys):
+        """Callable messages are evaluated and logged when DEBUG is on."""
+        with patch("hook_utils.DEBUG", True):
+            log_debug(lambda: "lazy msg")
+        assert capsys.readouterr().err == "[DEBUG] lazy msg\n"
+
 
 class TestParseHookInput:
     """Tests for parse_hook_input function."""
@@ -77,6 +106,78 @@ class TestParseHookInput:
         assert result == {"emoji": "🎉", "chinese": "中文"}
 
 
+def read_stdin_in_subprocess(data: bytes, max_bytes: int) -> subprocess.CompletedProcess:
+    """Call read_stdin_safe in a fresh interpreter fed with raw bytes."""
+    code = (
+        f"import sys; sys.path.insert(0, {str(HOOKS_DIR)!r})\n"
+        "from hook_utils import read_stdin_safe\n"
+        f"print(ascii(read_stdin_safe(max_bytes={max_bytes})))"
+    )
+    return subprocess.run([sys.executable, "-c", code], input=data, capture_output=True)
+
+
+class TestReadStdinSafe:
+    """Tests for read_stdin_safe function."""
+
+    def test_decodes_utf8(self):
+        result = read_stdin_in_subprocess('{"p": "caf\u00e9"}'.encode(), 100)
+        assert result.stdout.decode().strip() == ascii('{"p": "caf\u00e9"}')
+
+    def test_limit_counts_bytes(self):
+        """max_bytes applies to encoded size, not characters."""
+        result = read_stdin_in_subprocess("\u00e9\u00e9\u00e9".encode(), 4)
+        assert result.returncode != 0
+        assert b"StdinSizeError" in result.stderr
+
+
+class TestReadHookInput:
+    """Tests for read_hook_input function."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        read_hook_input.cache_clear()
+        yield
+        read_hook_input.cache_clear()
+
+    def test_reads_stdin_once(self):
+        """Repeated calls should parse stdin once and share the result."""
+        with patch("hook_utils.read_stdin_safe", return_value='{"cwd": "/x"}') as mock_read:
+            first = read_hook_input()
+            second = read_hook_input()
+        assert first == {"cwd": "/x"}
+        assert second is first
+        mock_read.assert_called_once()
+
+    def test_invalid_input_returns_empty(self):
+        """Invalid JSON on stdin should give an empty dict."""
+        with patch("hook_utils.read_stdin_safe", return_value="not json"):
+            assert read_hook_input() == {}
+
+
+class TestHookMain:
+    """Tests for hook_main decorator."""
+
+    @pytest.fixture(autouse=True)
+    def restore_gc(self):
+        yield
+        gc.enable()
+
+    def _decorate(self, module: str):
+        def main():
+            return gc.isenabled()
+
+        main.__module__ = module
+        return hook_main("Test")(main)
+
+    def test_disables_gc_when_run_as_script(self):
+        """A hook running as __main__ should turn off the cyclic collector."""
+        assert self._decorate("__main__")() is False
+
+    def test_leaves_gc_alone_when_imported(self):
+        """Imported hooks (e.g. under pytest) must not change GC state."""
+        assert self._decorate("some_hook")() is True
+
+
 class TestGetNested:
     """Tests for get_nested function."""
 
@@ -152,6 +253,26 @@ class TestRegexCache:
         cache.add("digits", r"\d+")
         assert cache.match("digits", "no numbers here") is None
 
+    def test_compiles_lazily_once(self):
+        """Patterns should be compiled on first match and then reused."""
+        cache = RegexCache()
+        with patch("hook_utils.re.compile", wraps=re.compile) as mock_compile:
+            cache.add("a", r"a+")
+            cache.add("b", r"b+")
+            assert mock_compile.call_count == 0
+            cache.match("a", "aaa")
+            cache.match("a", "aaa")
+            assert mock_compile.call_count == 1
+
+    def test_re_adding_replaces_pattern(self):
+        """Re-adding a name should replace an already compiled pattern."""
+        cache = RegexCache()
+        cache.add("p", r"foo")
+        assert cache.match("p", "foo") is not None
+        cache.add("p", r"bar")
+        assert cache.match("p", "foo") is None
+        assert cache.match("p", "bar") is not None
+
     def test_missing_pattern_raises_keyerror(self):
         """Missing pattern name should raise KeyError."""
         cache = RegexCache()
@@ -262,6 +383,16 @@ class TestOutputContext:
         result = json.loads(captured.out)
         assert result["hookSpecificOutput"]["additionalContext"] == context
 
+    def test_matches_compact_json_dumps(self, capsys):
+        """The template output should equal a compact json.dumps of the dict."""
+        context = 'quote " backslash \\ caf\u00e9'
+        output_context("Test", context)
+        expected = json.dumps(
+            {"hookSpecificOutput": {"hookEventName": "Test", "additionalContext": context}},
+            separators=(",", ":"),
+        )
+        assert capsys.readouterr().out == expected + "\n"
+
 
 class TestOutputBlock:
     """Tests for output_block function."""
@@ -411,3 +542,31 @@ class TestGetSessionContext:
         """Explicitly disabled teams should return 'solo'."""
         monkeypatch.setenv("CLAUDE_CODE_EXPERIMENTAL_AGENT_TEAMS", "0")
         assert get_session_context({}) == "solo"
+
+
+class TestSessionMarkers:
+    """Tests for the shared per-session marker helpers."""
+
+    def test_only_first_claim_succeeds(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("hook_utils.MARKER_DIR", str(tmp_path))
+        assert not has_marker("omc_reminded_sess")
+        assert claim_marker("omc_reminded_sess") is True
+        assert claim_marker("omc_reminded_sess") is False
+        assert has_marker("omc_reminded_sess")
+        assert (tmp_path / "omc_reminded_sess").exists()
+
+    def test_unusable_dir_does_not_suppress(self, tmp_path, monkeypatch):
+        """If the marker cannot be written, the caller still proceeds."""
+        monkeypatch.setattr("hook_utils.MARKER_DIR", str(tmp_path / "missing"))
+        assert claim_marker("omc_reminded_sess") is True
+
+    def test_marker_dir_follows_tmpdir(self, tmp_path):
+        """MARKER_DIR honours TMPDIR, like tempfile.gettempdir()."""
+        result = subprocess.run(
+            [sys.executable, "-c", "import hook_utils; print(hook_utils.MARKER_DIR)"],
+            capture_output=True,
+            text=True,
+            cwd=HOOKS_DIR,
+            env={"PATH": "/usr/bin:/bin", "TMPDIR": str(tmp_path)},
+        )
+        assert result.stdout.strip() == str(tmp_path)
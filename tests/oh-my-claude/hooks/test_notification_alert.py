@@ -7,11 +7,11 @@ import os
 import subprocess
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
-from notification_alert import get_notifier_command, send_notification
+from notification_alert import get_notifier_command, resolve_linux_notifier, send_notification
 
 HOOK_PATH = Path(__file__).parent.parent.parent.parent / "plugins/oh-my-claude/hooks/notification_alert.py"
 
@@ -39,6 +39,13 @@ def run_hook(input_data: dict, env: dict[str, str] | None = None) -> dict:
     return json.loads(result.stdout)
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep the notifier cache out of the real ~/.cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path / "oh-my-claude" / "notifier"
+
+
 # =============================================================================
 # Unit Tests: get_notifier_command
 # =============================================================================
@@ -64,6 +71,7 @@ class TestGetNotifierCommand:
             cmd = get_notifier_command("Title", "Message")
             assert cmd is not None
             assert cmd[0] == "powershell"
+            assert "-NoProfile" in cmd
 
     def test_linux_notify_send(self):
         """Should return notify-send on Linux when available."""
@@ -91,6 +99,41 @@ class TestGetNotifierCommand:
             assert cmd is None
 
 
+# =============================================================================
+# Unit Tests: resolve_linux_notifier
+# =============================================================================
+
+
+class TestResolveLinuxNotifier:
+    """Tests for the cached notifier lookup."""
+
+    def test_caches_detected_notifier(self, isolated_cache, tmp_path):
+        """A detected notifier is remembered and reused without probing."""
+        binary = tmp_path / "zenity"
+        binary.write_text("#!/bin/sh\n")
+        binary.chmod(0o755)
+        with patch("notification_alert._detect_linux_notifier", return_value=("zenity", str(binary))):
+            assert resolve_linux_notifier() == "zenity"
+        assert isolated_cache.read_text().strip() == f"zenity {binary}"
+
+        with patch("notification_alert._detect_linux_notifier") as mock_detect:
+            assert resolve_linux_notifier() == "zenity"
+            mock_detect.assert_not_called()
+
+    def test_stale_cache_is_re_detected(self, isolated_cache):
+        """A cached binary that no longer exists triggers a new probe."""
+        isolated_cache.parent.mkdir(parents=True)
+        isolated_cache.write_text("notify-send /nonexistent/notify-send\n")
+        with patch("notification_alert._detect_linux_notifier", return_value=None) as mock_detect:
+            assert resolve_linux_notifier() is None
+            mock_detect.assert_called_once()
+
+    def test_missing_notifier_not_cached(self, isolated_cache):
+        with patch("notification_alert._detect_linux_notifier", return_value=None):
+            assert resolve_linux_notifier() is None
+        assert not isolated_cache.exists()
+
+
 # =============================================================================
 # Unit Tests: send_notification
 # =============================================================================
@@ -100,24 +143,27 @@ class TestSendNotification:
     """Tests for send_notification function."""
 
     def test_returns_true_on_success(self):
-        """Should return True when notification command succeeds."""
+        """Should return True once the notification command is launched."""
         with patch("notification_alert.get_notifier_command", return_value=["echo", "test"]), \
-             patch("notification_alert.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
+             patch("notification_alert.subprocess.Popen") as mock_popen:
             assert send_notification("Title", "Message") is True
+            mock_popen.assert_called_once()
 
-    def test_returns_false_on_timeout(self):
-        """Should return False when notification command times out."""
-        with patch("notification_alert.get_notifier_command", return_value=["slow", "cmd"]), \
-             patch("notification_alert.subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired(cmd="slow", timeout=10)
-            assert send_notification("Title", "Message") is False
+    def test_does_not_wait_for_notifier(self):
+        """A slow notifier must not hold up the hook."""
+        with patch("notification_alert.get_notifier_command", return_value=["sleep", "5"]), \
+             patch("notification_alert.subprocess.Popen") as mock_popen:
+            assert send_notification("Title", "Message") is True
+        assert mock_popen.call_args.kwargs["start_new_session"] is True
+        process = mock_popen.return_value
+        process.wait.assert_not_called()
+        process.communicate.assert_not_called()
 
     def test_returns_false_on_error(self):
         """Should return False when notification command raises exception."""
         with patch("notification_alert.get_notifier_command", return_value=["bad", "cmd"]), \
-             patch("notification_alert.subprocess.run") as mock_run:
-            mock_run.side_effect = OSError("command not found")
+             patch("notification_alert.subprocess.Popen") as mock_popen:
+            mock_popen.side_effect = OSError("command not found")
             assert send_notification("Title", "Message") is False
 
     def test_returns_false_when_no_notifier(self):
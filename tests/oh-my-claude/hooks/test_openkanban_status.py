@@ -144,6 +144,20 @@ class TestMainIntegration:
         output = run_hook({"session_id": "test"}, env=env)
         assert output == {}
 
+    def test_no_session_exits_before_importing_hook_utils(self):
+        """Without OPENKANBAN_SESSION the hook should not load hook_utils at all."""
+        env = {"PATH": os.environ.get("PATH", "/usr/bin:/bin")}
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", str(HOOK_PATH)],
+            input="{}",
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        assert result.returncode == 0
+        assert result.stdout == ""
+        assert "hook_utils" not in result.stderr
+
     def test_session_start_writes_idle(self, tmp_path):
         """SessionStart hookEventName should write idle status."""
         env = {
@@ -224,6 +238,45 @@ class TestMainIntegration:
         # Still returns empty (hook never blocks)
         assert output == {}
 
+    @pytest.mark.parametrize(
+        "payload,expected",
+        [
+            ({"hookEventName": "SessionStart", "session_id": "test"}, "idle"),
+            ({"hookEventName": "UserPromptSubmit", "prompt": "fix bug"}, "working"),
+            ({"hookEventName": "PreToolUse", "tool_name": "Edit"}, "working"),
+            ({"hookEventName": "PermissionRequest", "permission": "ask"}, "waiting"),
+            ({"hookEventName": "Stop", "stopReason": "end_turn"}, "idle"),
+            ({"hookEventName": "UnknownEvent", "prompt": "something"}, "working"),
+        ],
+    )
+    def test_event_status_written(self, tmp_path, payload, expected):
+        """Named events with their required fields write the mapped status."""
+        env = {
+            "PATH": os.environ.get("PATH", "/usr/bin:/bin"),
+            "HOME": str(tmp_path),
+            "OPENKANBAN_SESSION": "test-session",
+        }
+        run_hook(payload, env=env)
+        status_file = tmp_path / ".cache" / "openkanban-status" / "test-session.status"
+        assert status_file.read_text() == expected
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"hookEventName": "Stop"},
+            {"hookEventName": "PreToolUse", "tool_name": "Edit", "tool_result": {}},
+        ],
+    )
+    def test_event_without_required_fields_writes_nothing(self, tmp_path, payload):
+        """Named events missing their fields fall back to data shape."""
+        env = {
+            "PATH": os.environ.get("PATH", "/usr/bin:/bin"),
+            "HOME": str(tmp_path),
+            "OPENKANBAN_SESSION": "test-session",
+        }
+        run_hook(payload, env=env)
+        assert not (tmp_path / ".cache" / "openkanban-status" / "test-session.status").exists()
+
     def test_empty_input_with_session(self, tmp_path):
         """Empty data with OPENKANBAN_SESSION should not crash."""
         env = {
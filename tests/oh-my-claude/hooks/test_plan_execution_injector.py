@@ -8,6 +8,8 @@ from pathlib import Path
 
 import pytest
 
+from plan_execution_injector import cleanup_drafts, track_plan_state
+
 HOOK_PATH = (
     Path(__file__).parent.parent.parent.parent
     / "plugins/oh-my-claude/hooks/plan_execution_injector.py"
@@ -203,3 +205,37 @@ class TestTeamModeExecution:
         result_teams = run_hook(input_data, env=env_teams)
         context_teams = result_teams.get("hookSpecificOutput", {}).get("additionalContext", "")
         assert "worker" not in context_teams.lower()
+
+
+class TestCleanupDrafts:
+    """Tests for cleanup_drafts function."""
+
+    def test_removes_drafts_and_empty_dir(self, tmp_path):
+        drafts = tmp_path / ".claude" / "plans" / "drafts"
+        drafts.mkdir(parents=True)
+        (drafts / "a.md").write_text("a")
+        (drafts / "b.md").write_text("b")
+        cleanup_drafts(str(tmp_path))
+        assert not drafts.exists()
+
+    def test_keeps_dir_with_other_files(self, tmp_path):
+        drafts = tmp_path / ".claude" / "plans" / "drafts"
+        drafts.mkdir(parents=True)
+        (drafts / "a.md").write_text("a")
+        (drafts / "notes.txt").write_text("keep")
+        cleanup_drafts(str(tmp_path))
+        assert sorted(p.name for p in drafts.iterdir()) == ["notes.txt"]
+
+
+class TestTrackPlanState:
+    """Tests for track_plan_state function."""
+
+    def test_writes_state_with_utc_timestamp(self, tmp_path):
+        from datetime import datetime
+
+        track_plan_state({"session_id": "s1"}, str(tmp_path))
+        state = json.loads((tmp_path / ".claude" / "plans" / ".active-plan.json").read_text())
+        assert state["status"] == "executing"
+        assert state["session_id"] == "s1"
+        approved = datetime.fromisoformat(state["approved_at"])
+        assert approved.utcoffset().total_seconds() == 0
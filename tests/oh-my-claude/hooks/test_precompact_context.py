@@ -55,6 +55,17 @@ class TestGetGitState:
         assert state["uncommitted_changes"] is False
         assert state["staged_files"] == []
 
+    def test_get_git_state_reports_all_fields(self, tmp_path):
+        """Branch, change flag and staged files all come from the same repo."""
+        subprocess.run(["git", "init", "-q", "-b", "work", str(tmp_path)], check=True)
+        (tmp_path / "a.txt").write_text("a")
+        subprocess.run(["git", "-C", str(tmp_path), "add", "a.txt"], check=True)
+        state = get_git_state(str(tmp_path))
+        # rev-parse fails before the first commit, so the branch is unknown
+        assert state["branch"] == "unknown"
+        assert state["uncommitted_changes"] is True
+        assert state["staged_files"] == ["a.txt"]
+
 
 class TestDetectMode:
     """Tests for detect_mode function."""
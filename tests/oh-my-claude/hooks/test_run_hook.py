@@ -0,0 +1,126 @@
+"""Tests for run_hook.sh cached-interpreter launcher."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+HOOKS_DIR = Path(__file__).parent.parent.parent.parent / "plugins/oh-my-claude/hooks"
+LAUNCHER = HOOKS_DIR / "run_hook.sh"
+HOOK_PATH = HOOKS_DIR / "context_guardian.py"
+
+
+@pytest.fixture
+def fake_uv(tmp_path):
+    """Create a fake `uv` on PATH that reports sys.executable and logs calls."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "uv.log"
+    uv = bin_dir / "uv"
+    uv.write_text(f'#!/bin/sh\necho "$@" >> "{log}"\necho "{sys.executable}"\n')
+    uv.chmod(0o755)
+    return bin_dir, log
+
+
+@pytest.fixture
+def managed_only_uv(tmp_path):
+    """Fake `uv` for a machine with no system Python, only uv-managed ones.
+
+    `python find --system` finds nothing; without it the managed interpreter
+    (sys.executable) is reported. `run` logs the call and exits.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "uv.log"
+    uv = bin_dir / "uv"
+    uv.write_text(
+        "#!/bin/sh\n"
+        f'echo "$@" >> "{log}"\n'
+        'case "$*" in\n'
+        '    *--system*) exit 2 ;;\n'
+        f'    "python find"*) echo "{sys.executable}" ;;\n'
+        "esac\n"
+    )
+    uv.chmod(0o755)
+    return bin_dir, log
+
+
+def run_launcher(
+    tmp_path: Path, bin_dir: Path, hook_path: Path = HOOK_PATH
+) -> subprocess.CompletedProcess:
+    """Run a hook (context_guardian.py by default) through the launcher with an isolated cache."""
+    env = os.environ.copy()
+    env["XDG_CACHE_HOME"] = str(tmp_path / "cache")
+    env["PATH"] = f"{bin_dir}{os.pathsep}/usr/bin{os.pathsep}/bin"
+    env.pop("CLAUDE_CODE_EXPERIMENTAL_AGENT_TEAMS", None)
+    return subprocess.run(
+        ["sh", str(LAUNCHER), str(hook_path)],
+        input=json.dumps({}),
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+
+class TestInterpreterCache:
+    """Tests for interpreter resolution and caching."""
+
+    def test_resolves_via_uv_and_runs_hook(self, tmp_path, fake_uv):
+        """First run resolves the interpreter with uv and runs the hook."""
+        bin_dir, log = fake_uv
+        result = run_launcher(tmp_path, bin_dir)
+        assert result.returncode == 0, result.stderr
+        output = json.loads(result.stdout)
+        assert "Context Protection ACTIVE" in output["hookSpecificOutput"]["additionalContext"]
+        assert "python find" in log.read_text()
+
+    def test_caches_interpreter_path(self, tmp_path, fake_uv):
+        """Resolved interpreter path is written to the cache file."""
+        bin_dir, _ = fake_uv
+        run_launcher(tmp_path, bin_dir)
+        cache_file = tmp_path / "cache" / "oh-my-claude" / "python"
+        assert cache_file.read_text().strip() == sys.executable
+
+    def test_cached_interpreter_skips_uv(self, tmp_path, fake_uv):
+        """Later runs exec the cached interpreter without calling uv."""
+        bin_dir, log = fake_uv
+        run_launcher(tmp_path, bin_dir)
+        log.unlink()
+        result = run_launcher(tmp_path, bin_dir)
+        assert result.returncode == 0, result.stderr
+        assert not log.exists()
+
+    def test_stale_cache_is_re_resolved(self, tmp_path, fake_uv):
+        """A cached path that is no longer executable triggers re-resolution."""
+        bin_dir, log = fake_uv
+        cache_file = tmp_path / "cache" / "oh-my-claude" / "python"
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text(str(tmp_path / "missing-python") + "\n")
+        result = run_launcher(tmp_path, bin_dir)
+        assert result.returncode == 0, result.stderr
+        assert "python find" in log.read_text()
+        assert cache_file.read_text().strip() == sys.executable
+
+    def test_interpreter_skips_site(self, tmp_path, fake_uv):
+        """Hooks run with -S, so site.py is never imported."""
+        bin_dir, _ = fake_uv
+        probe = tmp_path / "probe.py"
+        probe.write_text("import sys\nprint(sys.flags.no_site, 'site' in sys.modules)\n")
+        result = run_launcher(tmp_path, bin_dir, probe)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "1 False"
+
+    def test_uses_uv_managed_interpreter(self, tmp_path, managed_only_uv):
+        """With no system Python, the uv-managed interpreter is found and cached."""
+        bin_dir, log = managed_only_uv
+        result = run_launcher(tmp_path, bin_dir)
+        assert result.returncode == 0, result.stderr
+        assert "Context Protection ACTIVE" in result.stdout
+        calls = log.read_text()
+        assert "--no-project" in calls
+        assert "run --script" not in calls
+        cache_file = tmp_path / "cache" / "oh-my-claude" / "python"
+        assert cache_file.read_text().strip() == sys.executable
@@ -9,6 +9,7 @@ from unittest.mock import patch
 import pytest
 
 from tdd_enforcer import (
+    file_suffix,
     get_tdd_mode,
     is_source_file,
     is_test_file,
@@ -59,6 +60,18 @@ class TestGetTddMode:
             assert get_tdd_mode() == "off"
 
 
+class TestFileSuffix:
+    """Tests for file_suffix function."""
+
+    @pytest.mark.parametrize(
+        "path",
+        ["src/app.ts", "a/b.test.tsx", "Makefile", ".bashrc", "dir.d/file", "name.", "/abs/x.PY", ""],
+    )
+    def test_matches_pathlib_suffix(self, path):
+        """file_suffix agrees with Path.suffix."""
+        assert file_suffix(path) == Path(path).suffix
+
+
 class TestIsSourceFile:
     """Tests for is_source_file function."""
 